@@ -14,10 +14,12 @@ from typing import Annotated, Optional
 
 from fastapi import Depends, HTTPException, Query, status
 
-from app.core import logger, settings
+from app.core import Settings, get_logger, get_settings
 from app.services.extraction import ExtractionOrchestrator
 from app.services.extraction.validator import ExtractionValidator, ValidationConfig
 
+logger = get_logger()
+
 # ===========================================
 # Service Singletons
 # ===========================================
@@ -179,19 +181,28 @@ class RateLimiter:
             return True
 
 
-# Global rate limiter instance
-_rate_limiter = RateLimiter(requests_per_minute=settings.api_rate_limit)
+@lru_cache
+def get_rate_limiter(requests_per_minute: int) -> RateLimiter:
+    """
+    Get the rate limiter for a given limit.
+
+    One limiter is kept per configured limit, so changing
+    ``api_rate_limit`` starts a fresh window instead of reusing stale counts.
+    """
+    return RateLimiter(requests_per_minute=requests_per_minute)
 
 
 async def check_rate_limit(
     client_ip: str = "default",
+    settings: Settings = Depends(get_settings),
 ) -> None:
     """
     Rate limiting dependency.
 
     Raises HTTPException if rate limit exceeded.
     """
-    if not await _rate_limiter.check_rate_limit(client_ip):
+    rate_limiter = get_rate_limiter(settings.api_rate_limit)
+    if not await rate_limiter.check_rate_limit(client_ip):
         logger.warning(f"Rate limit exceeded for client: {client_ip}")
         raise HTTPException(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
@@ -224,7 +235,7 @@ def validate_file_extension(filename: str) -> str:
     import os
 
     ext = os.path.splitext(filename)[1].lower()
-    allowed = settings.allowed_extensions_list
+    allowed = get_settings().allowed_extensions_list
 
     if ext not in allowed:
         raise HTTPException(
@@ -249,14 +260,15 @@ def validate_file_size(size: int) -> None:
     Raises:
         HTTPException if file too large
     """
-    max_size = settings.max_upload_size_mb * 1024 * 1024
+    max_size_mb = get_settings().max_upload_size_mb
+    max_size = max_size_mb * 1024 * 1024
 
     if size > max_size:
         raise HTTPException(
             status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
             detail={
                 "error": "File too large",
-                "message": f"File size exceeds {settings.max_upload_size_mb}MB limit",
+                "message": f"File size exceeds {max_size_mb}MB limit",
                 "max_size_bytes": max_size,
                 "actual_size_bytes": size,
             },
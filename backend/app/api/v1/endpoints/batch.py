@@ -7,16 +7,16 @@ Handles multiple PDF files (up to 5) in a single request for efficient processin
 import asyncio
 import time
 import uuid
-from datetime import datetime
 from pathlib import Path
 from typing import Any, List, Optional
 
-from fastapi import APIRouter, File, Form, HTTPException, UploadFile, status
-from pydantic import BaseModel
+from fastapi import APIRouter, File, Form, HTTPException, Response, UploadFile, status
 
-from app.core import logger, settings
+from app.core import get_logger, get_settings
 from app.core.exceptions import PDFExtractorError
+from app.schemas.base import utc_now
 from app.schemas.extraction import (
+    BatchExtractionResponse,
     DocumentMetadata,
     DocumentType,
     ExtractionMetrics,
@@ -28,23 +28,13 @@ from app.schemas.extraction import (
 from app.schemas.invoice import InvoiceData
 from app.services.extraction import ExtractionOrchestrator, validate_extraction
 
+logger = get_logger()
+
 router = APIRouter()
 
 # Configuration
 MAX_BATCH_SIZE = 5
 ALLOWED_EXTENSIONS = {".pdf"}
-MAX_FILE_SIZE = settings.max_upload_size_mb * 1024 * 1024
-
-
-class BatchExtractionResponse(BaseModel):
-    """Response for batch extraction."""
-
-    batch_id: str
-    total_files: int
-    successful: int
-    failed: int
-    total_time: float
-    results: List[ExtractionResponse]
 
 
 def validate_file(file: UploadFile) -> None:
@@ -59,6 +49,7 @@ def validate_file(file: UploadFile) -> None:
 
 async def save_temp_file(file: UploadFile) -> Path:
     """Save uploaded file to temporary location."""
+    settings = get_settings()
     temp_dir = Path(settings.temp_dir)
     temp_dir.mkdir(parents=True, exist_ok=True)
 
@@ -68,7 +59,7 @@ async def save_temp_file(file: UploadFile) -> Path:
 
     content = await file.read()
 
-    if len(content) > MAX_FILE_SIZE:
+    if len(content) > settings.max_upload_size_bytes:
         raise ValueError(
             f"File too large. Maximum size: {settings.max_upload_size_mb}MB"
         )
@@ -238,9 +229,10 @@ async def process_single_file(
                         critical_issues=1,
                     )
 
-            return ExtractionResponse(
+            # All parts were built and validated above
+            return ExtractionResponse.model_construct(
                 request_id=request_id,
-                timestamp=datetime.utcnow(),
+                timestamp=utc_now(),
                 status=ExtractionStatus.SUCCESS,
                 stage=ProcessingStage.COMPLETE,
                 document=doc_metadata,
@@ -252,12 +244,13 @@ async def process_single_file(
         else:
             return ExtractionResponse(
                 request_id=request_id,
-                timestamp=datetime.utcnow(),
+                timestamp=utc_now(),
                 status=ExtractionStatus.FAILED,
                 stage=ProcessingStage.LLM_EXTRACTION,
                 error={
                     "code": "EXTRACTION_FAILED",
-                    "message": result.error or "Extraction failed",
+                    "message": (result.error or {}).get("message", "Extraction failed"),
+                    "stage": ProcessingStage.LLM_EXTRACTION,
                 },
             )
 
@@ -265,12 +258,13 @@ async def process_single_file(
         logger.error(f"[{request_id}] Error processing file: {e}")
         return ExtractionResponse(
             request_id=request_id,
-            timestamp=datetime.utcnow(),
+            timestamp=utc_now(),
             status=ExtractionStatus.FAILED,
             stage=ProcessingStage.UNKNOWN,
             error={
                 "code": "PROCESSING_ERROR",
                 "message": str(e),
+                "stage": ProcessingStage.UNKNOWN,
             },
         )
     finally:
@@ -298,7 +292,7 @@ async def extract_batch(
         default=True,
         description="Whether to validate extracted data",
     ),
-) -> BatchExtractionResponse:
+) -> Response:
     """
     Extract structured data from multiple PDF files.
 
@@ -308,6 +302,7 @@ async def extract_batch(
     """
     batch_id = f"batch_{uuid.uuid4().hex[:12]}"
     start_time = time.time()
+    started_at = utc_now()
 
     # Validate batch size
     if len(files) > MAX_BATCH_SIZE:
@@ -349,11 +344,26 @@ async def extract_batch(
         f"in {total_time:.2f}s"
     )
 
-    return BatchExtractionResponse(
+    if failed == 0:
+        batch_status = ExtractionStatus.SUCCESS
+    elif successful == 0:
+        batch_status = ExtractionStatus.FAILED
+    else:
+        batch_status = ExtractionStatus.PARTIAL
+
+    batch = BatchExtractionResponse.model_construct(
         batch_id=batch_id,
         total_files=len(files),
+        processed=len(results),
         successful=successful,
         failed=failed,
         total_time=total_time,
-        results=results,
+        results=list(results),
+        status=batch_status,
+        started_at=started_at,
+        completed_at=utc_now(),
     )
+    # Serialize straight to JSON in pydantic-core; returning the model would
+    # make FastAPI re-validate it, dump it to Python objects and then encode
+    # those again
+    return Response(batch.model_dump_json(), media_type="application/json")
@@ -8,14 +8,23 @@ and extracting structured data using the LLM-powered extraction pipeline.
 import asyncio
 import time
 import uuid
-from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
-from fastapi import APIRouter, File, Form, HTTPException, UploadFile, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Form,
+    HTTPException,
+    Response,
+    UploadFile,
+    status,
+)
 
-from app.core import logger, settings
+from app.core import Settings, get_logger, get_settings
 from app.core.exceptions import PDFExtractorError
+from app.schemas.base import utc_now
 from app.schemas.extraction import (
     DocumentMetadata,
     DocumentType,
@@ -28,14 +37,13 @@ from app.schemas.extraction import (
 from app.schemas.invoice import InvoiceData
 from app.services.extraction import ExtractionOrchestrator, validate_extraction
 
+logger = get_logger()
+
 router = APIRouter()
 
 # Allowed file extensions
 ALLOWED_EXTENSIONS = {".pdf"}
 
-# Maximum file size in bytes (from settings)
-MAX_FILE_SIZE = settings.max_upload_size_mb * 1024 * 1024
-
 
 def validate_file(file: UploadFile) -> None:
     """
@@ -79,6 +87,7 @@ async def save_temp_file(file: UploadFile) -> Path:
         Path to the saved temporary file.
     """
     # Create temp directory if it doesn't exist
+    settings = get_settings()
     temp_dir = Path(settings.temp_dir)
     temp_dir.mkdir(parents=True, exist_ok=True)
 
@@ -91,7 +100,7 @@ async def save_temp_file(file: UploadFile) -> Path:
     content = await file.read()
 
     # Check file size
-    if len(content) > MAX_FILE_SIZE:
+    if len(content) > settings.max_upload_size_bytes:
         raise HTTPException(
             status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
             detail=f"File too large. Maximum size: {settings.max_upload_size_mb}MB",
@@ -166,6 +175,7 @@ async def extract_from_pdf(
         default=False,
         description="Include raw text preview in response",
     ),
+    settings: Settings = Depends(get_settings),
 ) -> ExtractionResponse:
     """
     Extract structured data from an uploaded PDF file.
@@ -351,9 +361,10 @@ async def extract_from_pdf(
                         critical_issues=1,
                     )
 
-            response = ExtractionResponse(
+            # All parts were built and validated above
+            response = ExtractionResponse.model_construct(
                 request_id=request_id,
-                timestamp=datetime.utcnow(),
+                timestamp=utc_now(),
                 status=ExtractionStatus.SUCCESS,
                 stage=ProcessingStage.COMPLETE,
                 document=doc_metadata,
@@ -370,7 +381,9 @@ async def extract_from_pdf(
                 f"Type: {result.document_type}, Fields: {field_count}"
             )
 
-            return response
+            # Serialize here so FastAPI does not re-validate the constructed
+            # model against response_model before encoding it
+            return Response(response.model_dump_json(), media_type="application/json")
 
         else:
             # Extraction failed
@@ -499,15 +512,13 @@ def build_error_response(
     Returns:
         ExtractionResponse with error status
     """
-    from datetime import datetime
-
     # Map stage string to enum value
     stage_map = {s.value: s for s in ProcessingStage}
     processing_stage = stage_map.get(stage, ProcessingStage.UNKNOWN)
 
     return ExtractionResponse(
         request_id=request_id,
-        timestamp=datetime.utcnow(),
+        timestamp=utc_now(),
         status=ExtractionStatus.FAILED,
         stage=processing_stage,
         error={
@@ -542,11 +553,8 @@ def build_success_response(
     Returns:
         ExtractionResponse with success status
     """
-    from datetime import datetime
-
     # Build document metadata
-    doc_type_map = {d.value: d for d in DocumentType}
-    detected_type = doc_type_map.get(document_type, DocumentType.UNKNOWN)
+    detected_type = DocumentType.from_value(document_type)
 
     doc_metadata = DocumentMetadata(
         filename=original_filename,
@@ -563,9 +571,9 @@ def build_success_response(
         total_time=processing_time,
     )
 
-    return ExtractionResponse(
+    return ExtractionResponse.model_construct(
         request_id=request_id,
-        timestamp=datetime.utcnow(),
+        timestamp=utc_now(),
         status=ExtractionStatus.SUCCESS,
         stage=ProcessingStage.COMPLETE,
         document=doc_metadata,
@@ -11,10 +11,11 @@ from datetime import datetime
 from typing import Any, Optional
 
 import httpx
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Depends, status
 from pydantic import BaseModel, Field
 
-from app.core import settings
+from app.core import Settings, get_settings
+from app.schemas.base import utc_now
 
 router = APIRouter()
 
@@ -33,7 +34,7 @@ class HealthResponse(BaseModel):
     """Health check response model."""
 
     status: str = Field(description="Overall system status")
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=utc_now)
     version: str = Field(description="Application version")
     uptime_seconds: Optional[float] = None
     components: list[ComponentStatus] = Field(default_factory=list)
@@ -62,6 +63,7 @@ def get_startup_time() -> float:
 
 async def check_ollama_health() -> ComponentStatus:
     """Check Ollama service health."""
+    settings = get_settings()
     start = time.time()
 
     try:
@@ -134,6 +136,7 @@ def get_system_info() -> dict[str, Any]:
 )
 async def health_check(
     include_details: bool = False,
+    settings: Settings = Depends(get_settings),
 ) -> HealthResponse:
     """
     Comprehensive health check endpoint.
@@ -161,7 +164,7 @@ async def health_check(
 
     return HealthResponse(
         status=overall_status,
-        timestamp=datetime.utcnow(),
+        timestamp=utc_now(),
         version=settings.app_version,
         uptime_seconds=round(uptime, 2),
         components=components,
@@ -175,7 +178,9 @@ async def health_check(
     summary="Readiness check",
     description="Check if the service is ready to accept requests.",
 )
-async def readiness_check() -> ReadinessResponse:
+async def readiness_check(
+    settings: Settings = Depends(get_settings),
+) -> ReadinessResponse:
     """
     Readiness probe for container orchestration.
 
@@ -222,7 +227,9 @@ async def liveness_check() -> dict[str, str]:
     summary="LLM health check",
     description="Check LLM service status and connectivity.",
 )
-async def llm_health_check() -> ComponentStatus:
+async def llm_health_check(
+    settings: Settings = Depends(get_settings),
+) -> ComponentStatus:
     """
     Detailed LLM health check.
 
@@ -246,7 +253,9 @@ async def llm_health_check() -> ComponentStatus:
     summary="API information",
     description="Get API configuration and capabilities.",
 )
-async def api_info() -> dict[str, Any]:
+async def api_info(
+    settings: Settings = Depends(get_settings),
+) -> dict[str, Any]:
     """
     Get API information and capabilities.
 
@@ -9,24 +9,26 @@ import time
 from pathlib import Path
 from typing import Annotated, Any
 
-from fastapi import APIRouter, File, Form, HTTPException, UploadFile
+from fastapi import APIRouter, File, Form, HTTPException, Request, UploadFile
 
-from app.core import logger
+from app.core import get_logger, get_settings
 from app.schemas.ats import ATSScoreResult, ResumeJDAnalysisResult
 from app.schemas.candidate import (
     CandidateComparison,
     FullCandidateAnalysis,
     RankingResult,
 )
-from app.services.ats import get_ats_analyzer
+from app.services.ats import JDContext, get_ats_analyzer
 from app.services.candidate import get_candidate_analyzer, get_candidate_ranker
 from app.services.extraction import ExtractionOrchestrator
-from app.services.llm import get_llm_client
+from app.services.llm import get_jd_cache, get_llm_client
 from app.services.llm.parser import parse_llm_response
 from app.services.llm.prompts import format_jd_extraction_prompt
 from app.services.pdf import extract_text_from_pdf, process_text
 from app.utils.file_handler import cleanup_temp_file, save_temp_file
 
+logger = get_logger()
+
 router = APIRouter(prefix="/resume", tags=["resume"])
 
 
@@ -42,6 +44,13 @@ async def extract_jd_data(jd_text: str) -> dict[str, Any]:
     """
     logger.processing("job description extraction")
 
+    # Reuse the result if this exact JD was already extracted
+    jd_cache = get_jd_cache()
+    cached = jd_cache.get(jd_text)
+    if cached is not None:
+        logger.info("JD extraction served from cache")
+        return cached
+
     # Get LLM client
     llm = get_llm_client()
 
@@ -62,6 +71,8 @@ async def extract_jd_data(jd_text: str) -> dict[str, Any]:
         logger.warning(f"JD parsing failed: {parse_result.error}")
         return {}
 
+    jd_cache.put(jd_text, parse_result.data)
+
     logger.success("JD extraction complete")
     return parse_result.data
 
@@ -392,17 +403,53 @@ async def full_candidate_analysis(
             cleanup_temp_file(temp_jd_path)
 
 
+def get_analysis_semaphore(request: Request) -> asyncio.Semaphore:
+    """
+    Get the app's bound on resumes analyzed at once.
+
+    The lifespan creates it from ``max_concurrent_analyses``; without the
+    lifespan (e.g. a plain TestClient) it is created on first use.
+    """
+    state = request.app.state
+    if getattr(state, "analysis_semaphore", None) is None:
+        limit = get_settings().max_concurrent_analyses
+        state.analysis_semaphore = asyncio.Semaphore(limit)
+    return state.analysis_semaphore
+
+
 async def analyze_single_resume(
     resume_content: bytes,
     filename: str,
     jd_text: str,
     jd_data: dict[str, Any],
+    semaphore: asyncio.Semaphore,
+    jd_context: JDContext | None = None,
 ) -> FullCandidateAnalysis:
     """
     Analyze a single resume file asynchronously.
 
-    Helper function for batch processing.
+    Helper function for batch processing. The blocking extraction and LLM
+    work runs in the default executor so concurrent calls overlap, bounded
+    by semaphore. Pass a shared jd_context when scoring several resumes
+    against the same JD.
     """
+    async with semaphore:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            lambda: _analyze_single_resume_sync(
+                resume_content, filename, jd_data, jd_context
+            ),
+        )
+
+
+def _analyze_single_resume_sync(
+    resume_content: bytes,
+    filename: str,
+    jd_data: dict[str, Any],
+    jd_context: JDContext | None,
+) -> FullCandidateAnalysis:
+    """Extract, score and analyze one resume (blocking)."""
     start_time = time.time()
     temp_resume_path: Path | None = None
 
@@ -425,7 +472,7 @@ async def analyze_single_resume(
 
         # Calculate ATS score
         ats_analyzer = get_ats_analyzer()
-        ats_result = ats_analyzer.calculate_ats_score(resume_data, jd_data)
+        ats_result = ats_analyzer.calculate_ats_score(resume_data, jd_data, jd_context)
 
         # Perform fit analysis
         candidate_analyzer = get_candidate_analyzer()
@@ -481,6 +528,7 @@ async def analyze_single_resume(
     """,
 )
 async def rank_candidates(
+    request: Request,
     resume_files: Annotated[
         list[UploadFile], File(description="Resume PDF files (max 10)")
     ],
@@ -556,6 +604,9 @@ async def rank_candidates(
         # Extract JD data using LLM
         jd_data = await extract_jd_data(jd_processed.cleaned_text)
 
+        # Normalize the JD requirements once for all candidates
+        jd_context = JDContext.from_jd_data(jd_data)
+
         # Use provided job title/company or extract from JD
         final_job_title = job_title or jd_data.get("job_title")
         final_company_name = company_name or jd_data.get("company_name")
@@ -566,6 +617,8 @@ async def rank_candidates(
             content = await file.read()
             resume_contents.append((file.filename or "unknown.pdf", content))
 
+        semaphore = get_analysis_semaphore(request)
+
         # Process all resumes concurrently using asyncio.gather
         # This significantly speeds up processing for multiple files
         logger.processing(
@@ -582,6 +635,8 @@ async def rank_candidates(
                 filename=filename,
                 jd_text=jd_text,
                 jd_data=jd_data,
+                semaphore=semaphore,
+                jd_context=jd_context,
             )
             return (filename, analysis)
 
@@ -651,6 +706,7 @@ async def rank_candidates(
     """,
 )
 async def compare_candidates(
+    request: Request,
     resume_file_1: Annotated[UploadFile, File(description="First resume PDF file")],
     resume_file_2: Annotated[UploadFile, File(description="Second resume PDF file")],
     job_description_text: Annotated[
@@ -703,23 +759,31 @@ async def compare_candidates(
         # Extract JD data using LLM
         jd_data = await extract_jd_data(jd_processed.cleaned_text)
 
+        jd_context = JDContext.from_jd_data(jd_data)
+
         # Read resume contents
         content_1 = await resume_file_1.read()
         content_2 = await resume_file_2.read()
 
-        # Analyze both resumes
-        analysis_1 = await analyze_single_resume(
-            resume_content=content_1,
-            filename=resume_file_1.filename or "resume1.pdf",
-            jd_text=jd_text,
-            jd_data=jd_data,
-        )
-
-        analysis_2 = await analyze_single_resume(
-            resume_content=content_2,
-            filename=resume_file_2.filename or "resume2.pdf",
-            jd_text=jd_text,
-            jd_data=jd_data,
+        # Analyze both resumes concurrently
+        semaphore = get_analysis_semaphore(request)
+        analysis_1, analysis_2 = await asyncio.gather(
+            analyze_single_resume(
+                resume_content=content_1,
+                filename=resume_file_1.filename or "resume1.pdf",
+                jd_text=jd_text,
+                jd_data=jd_data,
+                semaphore=semaphore,
+                jd_context=jd_context,
+            ),
+            analyze_single_resume(
+                resume_content=content_2,
+                filename=resume_file_2.filename or "resume2.pdf",
+                jd_text=jd_text,
+                jd_data=jd_data,
+                semaphore=semaphore,
+                jd_context=jd_context,
+            ),
         )
 
         # Compare candidates
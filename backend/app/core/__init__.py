@@ -7,8 +7,14 @@ This module provides the foundational components for the PDF Intelligence Extrac
 - Custom exception hierarchy
 """
 
-from app.core.config import Settings, get_settings, settings
+from app.core.config import (
+    Settings,
+    get_settings,
+    reset_settings,
+    set_settings,
+)
 from app.core.exceptions import (
+    CODE_TO_STATUS,
     DocumentTypeDetectionError,
     EmptyPDFError,
     ExtractionError,
@@ -28,20 +34,22 @@ from app.core.exceptions import (
     ScannedPDFError,
     UnsupportedDocumentTypeError,
     ValidationError,
+    make_parse_error,
 )
-from app.core.logger import console, get_logger, log_startup_info, logger
+from app.core.logger import get_logger, log_shutdown_info, log_startup_info
 
 __all__ = [
     # Config
     "Settings",
-    "settings",
     "get_settings",
+    "set_settings",
+    "reset_settings",
     # Logger
-    "logger",
     "get_logger",
-    "console",
     "log_startup_info",
+    "log_shutdown_info",
     # Exceptions
+    "CODE_TO_STATUS",
     "PDFExtractorError",
     "FileError",
     "InvalidFileTypeError",
@@ -61,4 +69,5 @@ __all__ = [
     "UnsupportedDocumentTypeError",
     "ValidationError",
     "LowConfidenceError",
+    "make_parse_error",
 ]
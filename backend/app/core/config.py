@@ -5,21 +5,35 @@ Loads configuration from environment variables with sensible defaults
 optimized for CPU-only environments running Phi-3 Mini via Ollama.
 """
 
+import logging
+import os
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import List
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-# Find .env file relative to this config file
-_env_file = Path(__file__).parent.parent.parent / ".env"
+# Find .env file relative to this config file. Deployments that inject
+# configuration through the environment can set USE_DOTENV=0 to skip
+# reading and parsing the file altogether.
+_env_file: str | None = (
+    str(Path(__file__).parent.parent.parent / ".env")
+    if os.environ.get("USE_DOTENV", "1") != "0"
+    else None
+)
 
 
 class Settings(BaseSettings):
-    """Application settings loaded from environment variables."""
+    """
+    Application settings loaded from environment variables.
+
+    Values are also read from ``backend/.env`` unless the process is
+    started with ``USE_DOTENV=0``.
+    """
 
     model_config = SettingsConfigDict(
-        env_file=str(_env_file),
+        env_file=_env_file,
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
@@ -33,6 +47,12 @@ class Settings(BaseSettings):
     debug: bool = Field(default=False)
     log_level: str = Field(default="INFO")
 
+    @cached_property
+    def log_level_int(self) -> int:
+        """Numeric logging level resolved from log_level."""
+        level: int = getattr(logging, self.log_level)
+        return level
+
     # ===========================================
     # API Settings
     # ===========================================
@@ -46,11 +66,27 @@ class Settings(BaseSettings):
     # ===========================================
     cors_origins: str = Field(default="http://localhost:3000,http://localhost:5173,https://llm-powered-pdf-extractor.vercel.app")
 
-    @property
+    @cached_property
     def cors_origins_list(self) -> List[str]:
         """Parse CORS origins string into a list."""
         return [origin.strip() for origin in self.cors_origins.split(",")]
 
+    # Explicit lists let CORSMiddleware answer preflights with a plain
+    # membership check instead of its wildcard handling. Extend these if
+    # new HTTP methods or custom request headers are introduced.
+    cors_allow_methods: str = Field(default="GET,POST,OPTIONS")
+    cors_allow_headers: str = Field(default="Content-Type,Authorization")
+
+    @cached_property
+    def cors_allow_methods_list(self) -> List[str]:
+        """Parse allowed CORS methods string into a list."""
+        return [method.strip().upper() for method in self.cors_allow_methods.split(",")]
+
+    @cached_property
+    def cors_allow_headers_list(self) -> List[str]:
+        """Parse allowed CORS headers string into a list."""
+        return [header.strip() for header in self.cors_allow_headers.split(",")]
+
     # ===========================================
     # File Upload Settings
     # ===========================================
@@ -58,12 +94,12 @@ class Settings(BaseSettings):
     allowed_extensions: str = Field(default=".pdf")
     temp_dir: str = Field(default="./temp")
 
-    @property
+    @cached_property
     def max_upload_size_bytes(self) -> int:
         """Convert MB to bytes."""
         return self.max_upload_size_mb * 1024 * 1024
 
-    @property
+    @cached_property
     def allowed_extensions_list(self) -> List[str]:
         """Parse allowed extensions string into a list."""
         return [ext.strip().lower() for ext in self.allowed_extensions.split(",")]
@@ -90,6 +126,9 @@ class Settings(BaseSettings):
     max_text_length: int = Field(default=10000)
     chunk_size: int = Field(default=3000)
     min_confidence_threshold: float = Field(default=0.5)
+    # Resumes analyzed at once; each holds a worker thread for PDF
+    # extraction and blocking LLM calls
+    max_concurrent_analyses: int = Field(default=8, ge=1)
 
     # ===========================================
     # Validators
@@ -120,14 +159,44 @@ class Settings(BaseSettings):
         return v
 
 
+# Explicit instance installed via set_settings() (e.g. by tests)
+_settings_override: Settings | None = None
+
+
+@lru_cache
 def get_settings() -> Settings:
     """
-    Get settings instance.
+    Get the settings singleton.
 
-    Creates fresh instance to pick up .env changes.
+    Returns the instance installed via ``set_settings()`` if any,
+    otherwise a ``Settings`` built from the environment on first call.
     """
+    if _settings_override is not None:
+        return _settings_override
     return Settings()
 
 
-# Convenience instance for direct imports
-settings = get_settings()
+def set_settings(new_settings: Settings) -> None:
+    """
+    Override the instance returned by ``get_settings()``.
+
+    Consumers read settings through ``get_settings()`` when they run, so
+    endpoints, request handlers and loggers set up afterwards see the
+    override. App-wide options (CORS, docs URLs, API prefix) are read by
+    ``app.main.create_app()``, so build a new app to apply those.
+    Singletons already built from settings, such as the LLM client, keep
+    the values they were built with.
+
+    Args:
+        new_settings: Settings instance to serve from now on
+    """
+    global _settings_override
+    _settings_override = new_settings
+    get_settings.cache_clear()
+
+
+def reset_settings() -> None:
+    """Drop any override and rebuild settings from the environment on next use."""
+    global _settings_override
+    _settings_override = None
+    get_settings.cache_clear()
@@ -5,9 +5,113 @@ Provides structured error handling with error codes and
 detailed messages for different failure scenarios.
 """
 
+import dataclasses
+import sys
+from dataclasses import dataclass
 from typing import Any
 
 
+# ===========================================
+# Error Detail Records
+# ===========================================
+
+
+@dataclass(slots=True, frozen=True)
+class FileDetails:
+    """Details for errors about a single file."""
+
+    filename: str
+
+
+@dataclass(slots=True, frozen=True)
+class FileTypeDetails:
+    """Details for unsupported file type errors."""
+
+    filename: str
+    allowed_types: list[str]
+
+
+@dataclass(slots=True, frozen=True)
+class FileSizeDetails:
+    """Details for file size limit errors."""
+
+    filename: str
+    size_mb: float
+    max_size_mb: int
+
+
+@dataclass(slots=True, frozen=True)
+class FileReasonDetails:
+    """Details for file processing failures."""
+
+    filename: str
+    reason: str
+
+
+@dataclass(slots=True, frozen=True)
+class HostReasonDetails:
+    """Details for service connection failures."""
+
+    host: str
+    reason: str
+
+
+@dataclass(slots=True, frozen=True)
+class TimeoutDetails:
+    """Details for request timeouts."""
+
+    provider: str
+    timeout_seconds: int
+    elapsed_seconds: float | None
+
+
+@dataclass(slots=True, frozen=True)
+class ResponseDetails:
+    """Details for invalid or unparseable responses."""
+
+    reason: str
+    raw_response: str | None
+
+
+@dataclass(slots=True, frozen=True)
+class ParseDetails:
+    """Details for response parsing failures."""
+
+    reason: str
+    raw_prefix: str | None
+    raw_length: int | None
+
+
+@dataclass(slots=True, frozen=True)
+class ModelDetails:
+    """Details for missing model errors."""
+
+    model_name: str
+
+
+@dataclass(slots=True, frozen=True)
+class DocumentTypeDetails:
+    """Details for unsupported document type errors."""
+
+    detected_type: str
+    supported_types: list[str]
+
+
+@dataclass(slots=True, frozen=True)
+class ValidationDetails:
+    """Details for validation failures."""
+
+    errors: list[dict[str, Any]]
+
+
+@dataclass(slots=True, frozen=True)
+class ConfidenceDetails:
+    """Details for low confidence errors."""
+
+    confidence: float
+    threshold: float
+
+
 class PDFExtractorError(Exception):
     """Base exception for all PDF Extractor errors."""
 
@@ -16,6 +120,7 @@ class PDFExtractorError(Exception):
         message: str,
         code: str = "UNKNOWN_ERROR",
         details: dict[str, Any] | None = None,
+        details_obj: Any = None,
     ) -> None:
         """
         Initialize the exception.
@@ -24,12 +129,25 @@ class PDFExtractorError(Exception):
             message: Human-readable error message
             code: Error code for programmatic handling
             details: Additional error details
+            details_obj: Slotted detail record, converted to a dict on demand
         """
         self.message = message
-        self.code = code
-        self.details = details or {}
+        self.code = sys.intern(code)
+        self.details_obj = details_obj
+        self._details = details
         super().__init__(self.message)
 
+    @property
+    def details(self) -> dict[str, Any]:
+        """Additional error details as a dictionary."""
+        if self._details is None:
+            self._details = (
+                dataclasses.asdict(self.details_obj)
+                if self.details_obj is not None
+                else {}
+            )
+        return self._details
+
     def to_dict(self) -> dict[str, Any]:
         """Convert exception to dictionary for API responses."""
         return {
@@ -57,7 +175,7 @@ class FileNotFoundError(FileError):
         super().__init__(
             message=f"File not found: {filename}",
             code="FILE_NOT_FOUND",
-            details={"filename": filename},
+            details_obj=FileDetails(filename),
         )
 
 
@@ -68,7 +186,7 @@ class InvalidFileTypeError(FileError):
         super().__init__(
             message=f"Invalid file type. Allowed: {', '.join(allowed_types)}",
             code="INVALID_FILE_TYPE",
-            details={"filename": filename, "allowed_types": allowed_types},
+            details_obj=FileTypeDetails(filename, allowed_types),
         )
 
 
@@ -79,11 +197,7 @@ class FileTooLargeError(FileError):
         super().__init__(
             message=f"File too large ({size_mb:.1f}MB). Max: {max_size_mb}MB",
             code="FILE_TOO_LARGE",
-            details={
-                "filename": filename,
-                "size_mb": size_mb,
-                "max_size_mb": max_size_mb,
-            },
+            details_obj=FileSizeDetails(filename, size_mb, max_size_mb),
         )
 
 
@@ -105,7 +219,7 @@ class PDFExtractionError(PDFProcessingError):
         super().__init__(
             message=f"Failed to extract text from PDF: {reason}",
             code="PDF_EXTRACTION_FAILED",
-            details={"filename": filename, "reason": reason},
+            details_obj=FileReasonDetails(filename, reason),
         )
 
 
@@ -116,7 +230,7 @@ class ScannedPDFError(PDFProcessingError):
         super().__init__(
             message="PDF appears to be scanned/image-based. OCR not yet supported",
             code="SCANNED_PDF_NOT_SUPPORTED",
-            details={"filename": filename},
+            details_obj=FileDetails(filename),
         )
 
 
@@ -127,7 +241,7 @@ class EmptyPDFError(PDFProcessingError):
         super().__init__(
             message="PDF contains no extractable text",
             code="EMPTY_PDF",
-            details={"filename": filename},
+            details_obj=FileDetails(filename),
         )
 
 
@@ -149,7 +263,7 @@ class LLMConnectionError(LLMError):
         super().__init__(
             message=f"Cannot connect to LLM service at {host}: {reason}",
             code="LLM_CONNECTION_FAILED",
-            details={"host": host, "reason": reason},
+            details_obj=HostReasonDetails(host, reason),
         )
 
 
@@ -170,11 +284,7 @@ class LLMTimeoutError(LLMError):
         super().__init__(
             message=msg,
             code="LLM_TIMEOUT",
-            details={
-                "provider": provider,
-                "timeout_seconds": timeout_seconds,
-                "elapsed_seconds": elapsed_seconds,
-            },
+            details_obj=TimeoutDetails(provider, timeout_seconds, elapsed_seconds),
         )
 
 
@@ -185,7 +295,7 @@ class LLMResponseError(LLMError):
         super().__init__(
             message=f"Invalid LLM response: {reason}",
             code="LLM_INVALID_RESPONSE",
-            details={"reason": reason, "raw_response": raw_response},
+            details_obj=ResponseDetails(reason, raw_response),
         )
 
 
@@ -196,7 +306,7 @@ class ModelNotFoundError(LLMError):
         super().__init__(
             message=f"Model '{model_name}' not found. Run: ollama pull {model_name}",
             code="MODEL_NOT_FOUND",
-            details={"model_name": model_name},
+            details_obj=ModelDetails(model_name),
         )
 
 
@@ -228,10 +338,7 @@ class UnsupportedDocumentTypeError(ExtractionError):
         super().__init__(
             message=f"Document type '{detected_type}' is not supported",
             code="UNSUPPORTED_DOCUMENT_TYPE",
-            details={
-                "detected_type": detected_type,
-                "supported_types": supported_types,
-            },
+            details_obj=DocumentTypeDetails(detected_type, supported_types),
         )
 
 
@@ -242,7 +349,7 @@ class ValidationError(ExtractionError):
         super().__init__(
             message="Extracted data failed validation",
             code="VALIDATION_FAILED",
-            details={"errors": errors},
+            details_obj=ValidationDetails(errors),
         )
 
 
@@ -253,19 +360,76 @@ class LowConfidenceError(ExtractionError):
         super().__init__(
             message=f"Confidence ({confidence:.2%}) below threshold ({threshold:.2%})",
             code="LOW_CONFIDENCE",
-            details={"confidence": confidence, "threshold": threshold},
+            details_obj=ConfidenceDetails(confidence, threshold),
         )
 
 
 class ExtractionParseError(ExtractionError):
-    """Raised when parsing LLM extraction response fails."""
+    """
+    Raised when parsing LLM extraction response fails.
 
-    def __init__(self, reason: str, raw_response: str | None = None) -> None:
+    Only a prefix of the raw response is kept; use ``make_parse_error()``
+    to build one from a full response.
+    """
+
+    def __init__(
+        self,
+        reason: str,
+        raw_response_prefix: str | None = None,
+        raw_length: int | None = None,
+    ) -> None:
         super().__init__(
             message=f"Failed to parse extraction response: {reason}",
             code="EXTRACTION_PARSE_ERROR",
-            details={
-                "reason": reason,
-                "raw_response": raw_response[:500] if raw_response else None,
-            },
+            details_obj=ParseDetails(reason, raw_response_prefix, raw_length),
         )
+
+
+# Number of raw response characters kept on parse errors
+RAW_RESPONSE_PREFIX_LENGTH = 500
+
+
+def make_parse_error(raw: str, reason: str) -> ExtractionParseError:
+    """
+    Build an ExtractionParseError from a full raw LLM response.
+
+    Args:
+        raw: Complete raw response text
+        reason: Why parsing failed
+
+    Returns:
+        ExtractionParseError carrying a truncated prefix and the full length
+    """
+    return ExtractionParseError(
+        reason,
+        raw_response_prefix=raw[:RAW_RESPONSE_PREFIX_LENGTH],
+        raw_length=len(raw),
+    )
+
+
+# ===========================================
+# HTTP Status Mapping
+# ===========================================
+
+# Error code -> HTTP status for the API exception handler. Codes that are
+# not listed fall back to 400 Bad Request.
+CODE_TO_STATUS: dict[str, int] = {
+    sys.intern(code): status_code
+    for code, status_code in {
+        "FILE_NOT_FOUND": 404,
+        "INVALID_FILE_TYPE": 400,
+        "FILE_TOO_LARGE": 413,
+        "PDF_EXTRACTION_FAILED": 422,
+        "SCANNED_PDF_NOT_SUPPORTED": 422,
+        "EMPTY_PDF": 422,
+        "LLM_CONNECTION_FAILED": 503,
+        "LLM_TIMEOUT": 504,
+        "LLM_INVALID_RESPONSE": 502,
+        "MODEL_NOT_FOUND": 503,
+        "UNKNOWN_DOCUMENT_TYPE": 422,
+        "UNSUPPORTED_DOCUMENT_TYPE": 422,
+        "VALIDATION_FAILED": 422,
+        "LOW_CONFIDENCE": 422,
+        "EXTRACTION_PARSE_ERROR": 422,
+    }.items()
+}
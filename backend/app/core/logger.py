@@ -6,31 +6,41 @@ for the PDF Intelligence Extractor application.
 """
 
 import logging
-from typing import Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
-from rich.console import Console
-from rich.logging import RichHandler
-from rich.theme import Theme
+from app.core.config import get_settings
 
-from app.core.config import settings
+if TYPE_CHECKING:
+    from rich.console import Console
 
-# Custom theme for consistent styling
-CUSTOM_THEME = Theme(
-    {
-        "info": "cyan",
-        "warning": "yellow",
-        "error": "bold red",
-        "critical": "bold white on red",
-        "success": "bold green",
-        "debug": "dim",
-        "highlight": "bold magenta",
-        "path": "blue underline",
-        "number": "bold cyan",
-    }
-)
+# Custom theme for consistent styling (materialized lazily in _get_console)
+CUSTOM_THEME: dict[str, str] = {
+    "info": "cyan",
+    "warning": "yellow",
+    "error": "bold red",
+    "critical": "bold white on red",
+    "success": "bold green",
+    "debug": "dim",
+    "highlight": "bold magenta",
+    "path": "blue underline",
+    "number": "bold cyan",
+}
 
-# Global console instance with custom theme
-console = Console(theme=CUSTOM_THEME)
+# Global console instance, created on first use so Rich is only
+# imported by processes that actually log
+_console: "Console | None" = None
+
+
+def _get_console() -> "Console":
+    """Return the shared Rich console, creating it on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        from rich.theme import Theme
+
+        _console = Console(theme=Theme(CUSTOM_THEME))
+    return _console
 
 
 class AppLogger:
@@ -49,20 +59,32 @@ class AppLogger:
             name: Logger name for identification
         """
         self.name = name
-        self.logger = self._setup_logger()
+        self._logger: logging.Logger | None = None
+
+    @property
+    def logger(self) -> logging.Logger:
+        """The underlying logger, configured with Rich on first use."""
+        if self._logger is None:
+            self._logger = self._setup_logger()
+        return self._logger
 
     def _setup_logger(self) -> logging.Logger:
         """Configure and return a Rich-enabled logger."""
         # Create logger
         logger = logging.getLogger(self.name)
-        logger.setLevel(getattr(logging, settings.log_level))
 
-        # Remove existing handlers to avoid duplicates
-        logger.handlers.clear()
+        # Already configured - reuse the existing handlers as-is
+        if logger.handlers:
+            return logger
+
+        settings = get_settings()
+        logger.setLevel(settings.log_level_int)
+
+        from rich.logging import RichHandler
 
         # Rich handler for beautiful console output
         rich_handler = RichHandler(
-            console=console,
+            console=_get_console(),
             show_time=True,
             show_path=settings.debug,
             rich_tracebacks=True,
@@ -85,37 +107,39 @@ class AppLogger:
 
         return logger
 
-    def debug(self, message: str, **kwargs: Any) -> None:
+    def debug(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log debug message."""
-        self.logger.debug(message, **kwargs)
+        self.logger.debug(message, *args, **kwargs)
 
-    def info(self, message: str, **kwargs: Any) -> None:
+    def info(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log info message."""
-        self.logger.info(message, **kwargs)
+        self.logger.info(message, *args, **kwargs)
 
-    def warning(self, message: str, **kwargs: Any) -> None:
+    def warning(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log warning message."""
-        self.logger.warning(message, **kwargs)
+        self.logger.warning(message, *args, **kwargs)
 
-    def error(self, message: str, **kwargs: Any) -> None:
+    def error(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log error message."""
-        self.logger.error(message, **kwargs)
+        self.logger.error(message, *args, **kwargs)
 
-    def critical(self, message: str, **kwargs: Any) -> None:
+    def critical(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log critical message."""
-        self.logger.critical(message, **kwargs)
+        self.logger.critical(message, *args, **kwargs)
 
     def success(self, message: str) -> None:
         """Log success message with green styling."""
-        console.print(f"[success]✓ {message}[/success]")
+        _get_console().print(f"[success]✓ {message}[/success]")
 
     def step(self, step_num: int, total: int, message: str) -> None:
         """Log a processing step."""
-        console.print(f"[highlight]Step {step_num}/{total}:[/highlight] {message}")
+        _get_console().print(
+            f"[highlight]Step {step_num}/{total}:[/highlight] {message}"
+        )
 
     def processing(self, filename: str) -> None:
         """Log file processing start."""
-        console.print(f"\n[info]📄 Processing:[/info] [path]{filename}[/path]")
+        _get_console().print(f"\n[info]📄 Processing:[/info] [path]{filename}[/path]")
 
     def extraction_result(
         self,
@@ -125,7 +149,7 @@ class AppLogger:
         time_ms: int,
     ) -> None:
         """Log extraction results in a formatted way."""
-        console.print(
+        _get_console().print(
             f"\n[success]✓ Extraction Complete[/success]\n"
             f"  • Document Type: [highlight]{doc_type}[/highlight]\n"
             f"  • Fields Found: [number]{fields_found}[/number]\n"
@@ -134,10 +158,14 @@ class AppLogger:
         )
 
 
+@lru_cache(maxsize=None)
 def get_logger(name: str = "pdf-extractor") -> AppLogger:
     """
     Get a logger instance.
 
+    Instances are cached per name, so repeated calls return the same
+    logger without reconfiguring its handlers.
+
     Args:
         name: Logger name
 
@@ -147,12 +175,10 @@ def get_logger(name: str = "pdf-extractor") -> AppLogger:
     return AppLogger(name)
 
 
-# Default logger instance
-logger = get_logger()
-
-
 def log_startup_info() -> None:
     """Log application startup information."""
+    settings = get_settings()
+    console = _get_console()
     console.print("\n")
     console.rule("[bold blue]PDF Intelligence Extractor[/bold blue]")
     console.print(f"\n[info]Version:[/info] {settings.app_version}")
@@ -171,3 +197,8 @@ def log_startup_info() -> None:
         f"http://{settings.api_host}:{settings.api_port}[/success]\n"
     )
     console.rule()
+
+
+def log_shutdown_info() -> None:
+    """Log application shutdown message."""
+    _get_console().print("\n[warning]👋 Goodbye![/warning]\n")
@@ -5,15 +5,116 @@ PDF Intelligence Extractor - A production-grade system for extracting
 structured data from PDFs using local LLMs (Phi-3 Mini via Ollama).
 """
 
+import asyncio
 from contextlib import asynccontextmanager
-from typing import Any
+from typing import Any, Callable
 
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
 from app.api.v1 import api_router
-from app.core import PDFExtractorError, console, log_startup_info, logger, settings
+from app.core import (
+    CODE_TO_STATUS,
+    PDFExtractorError,
+    get_logger,
+    get_settings,
+    log_shutdown_info,
+    log_startup_info,
+)
+from app.schemas import (
+    BatchExtractionResponse,
+    DocumentMetadata,
+    ExtractionResponse,
+    InvoiceData,
+    LineItem,
+    ResumeData,
+    ValidationSummary,
+)
+
+logger = get_logger()
+
+_EMPTY_DETAILS: dict[str, Any] = {}
+
+
+def _render_static_payloads(app: FastAPI) -> None:
+    """
+    Pre-render the JSON bodies of the static info endpoints.
+
+    Their content only depends on settings, so it is serialized once when
+    the app is built instead of on every request.
+    """
+    settings = get_settings()
+    root_payload: dict[str, Any] = {
+        "name": settings.app_name,
+        "version": settings.app_version,
+        "status": "running",
+        "docs": "/docs" if settings.debug else "disabled",
+    }
+    health_payload: dict[str, Any] = {
+        "status": "healthy",
+        "version": settings.app_version,
+        "llm": {
+            "mode": settings.llm_mode,
+            "model": (
+                settings.ollama_model
+                if settings.llm_mode == "local"
+                else settings.groq_model
+            ),
+            "host": (
+                settings.ollama_host if settings.llm_mode == "local" else "groq-api"
+            ),
+        },
+        "config": {
+            "max_upload_size_mb": settings.max_upload_size_mb,
+            "supported_formats": settings.allowed_extensions_list,
+        },
+    }
+    api_health_payload: dict[str, Any] = {
+        "status": "healthy",
+        "api_version": "v1",
+    }
+
+    # Rendered by JSONResponse so the bytes match the API's other responses
+    app.state.root_json = JSONResponse(root_payload).body
+    app.state.health_json = JSONResponse(health_payload).body
+    app.state.api_health_json = JSONResponse(api_health_payload).body
+
+
+# Models declared with defer_build=True, whose validators are otherwise
+# built on first use
+DEFERRED_MODELS = (
+    InvoiceData,
+    LineItem,
+    ResumeData,
+    ExtractionResponse,
+    BatchExtractionResponse,
+    DocumentMetadata,
+    ValidationSummary,
+)
+
+
+def _build_deferred_schemas() -> None:
+    """
+    Build the validators of deferred models once at startup.
+
+    Deferring keeps imports (tests, scripts) cheap; building them here
+    keeps that one-off cost off the first request a worker serves.
+    """
+    for model in DEFERRED_MODELS:
+        model.model_rebuild()
+
+
+def _build_openapi_schema(app: FastAPI) -> None:
+    """
+    Build the OpenAPI schema ahead of the first docs request.
+
+    FastAPI caches the schema on the app after building it, but the first
+    build walks every nested response model. Doing that at startup keeps
+    it off the request path. Skipped when the docs are disabled.
+    """
+    if app.openapi_url:
+        app.openapi()
 
 
 @asynccontextmanager
@@ -24,6 +125,11 @@ async def lifespan(app: FastAPI):
     Handles startup and shutdown events.
     """
     # Startup
+    # Created here so the semaphore belongs to the serving event loop
+    limit = get_settings().max_concurrent_analyses
+    app.state.analysis_semaphore = asyncio.Semaphore(limit)
+    _build_deferred_schemas()
+    _build_openapi_schema(app)
     log_startup_info()
     logger.info("Application startup complete")
 
@@ -31,31 +137,7 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Application shutting down...")
-    console.print("\n[warning]👋 Goodbye![/warning]\n")
-
-
-# Create FastAPI application
-app = FastAPI(
-    title=settings.app_name,
-    description=(
-        "LLM-Powered PDF Intelligence Extraction System. "
-        "Extract structured data from invoices, resumes, and more."
-    ),
-    version=settings.app_version,
-    docs_url="/docs" if settings.debug else None,
-    redoc_url="/redoc" if settings.debug else None,
-    openapi_url="/openapi.json" if settings.debug else None,
-    lifespan=lifespan,
-)
-
-# Configure CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.cors_origins_list,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+    log_shutdown_info()
 
 
 # ===========================================
@@ -63,15 +145,14 @@ app.add_middleware(
 # ===========================================
 
 
-@app.exception_handler(PDFExtractorError)
 async def pdf_extractor_exception_handler(
     request: Request,
     exc: PDFExtractorError,
 ) -> JSONResponse:
     """Handle custom PDF Extractor exceptions."""
-    logger.error(f"[{exc.code}] {exc.message}")
+    logger.error("[%s] %s", exc.code, exc.message)
     return JSONResponse(
-        status_code=status.HTTP_400_BAD_REQUEST,
+        status_code=CODE_TO_STATUS.get(exc.code, status.HTTP_400_BAD_REQUEST),
         content={
             "success": False,
             "error": exc.to_dict(),
@@ -79,13 +160,12 @@ async def pdf_extractor_exception_handler(
     )
 
 
-@app.exception_handler(Exception)
 async def general_exception_handler(
     request: Request,
     exc: Exception,
 ) -> JSONResponse:
     """Handle unexpected exceptions."""
-    logger.error(f"Unexpected error: {str(exc)}")
+    logger.error("Unexpected error: %s", exc)
     return JSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
@@ -93,79 +173,117 @@ async def general_exception_handler(
             "error": {
                 "code": "INTERNAL_ERROR",
                 "message": "An unexpected error occurred",
-                "details": {"error": str(exc)} if settings.debug else {},
+                "details": (
+                    {"error": str(exc)} if get_settings().debug else _EMPTY_DETAILS
+                ),
             },
         },
     )
 
 
+# Registered in one go through the FastAPI constructor
+EXCEPTION_HANDLERS: dict[type[Exception], Callable[..., Any]] = {
+    PDFExtractorError: pdf_extractor_exception_handler,
+    Exception: general_exception_handler,
+}
+
+
 # ===========================================
 # Health Check Endpoints
 # ===========================================
 
 
-@app.get("/", tags=["Root"])
-async def root() -> dict[str, str]:
+async def root(request: Request) -> Response:
     """Root endpoint - API information."""
-    return {
-        "name": settings.app_name,
-        "version": settings.app_version,
-        "status": "running",
-        "docs": "/docs" if settings.debug else "disabled",
-    }
+    return Response(request.app.state.root_json, media_type="application/json")
 
 
-@app.get("/health", tags=["Health"])
-async def health_check() -> dict[str, Any]:
+async def health_check(request: Request) -> Response:
     """
     Health check endpoint.
 
     Returns system status and configuration info.
     """
-    return {
-        "status": "healthy",
-        "version": settings.app_version,
-        "llm": {
-            "mode": settings.llm_mode,
-            "model": (
-                settings.ollama_model
-                if settings.llm_mode == "local"
-                else settings.groq_model
-            ),
-            "host": (
-                settings.ollama_host if settings.llm_mode == "local" else "groq-api"
-            ),
-        },
-        "config": {
-            "max_upload_size_mb": settings.max_upload_size_mb,
-            "supported_formats": settings.allowed_extensions_list,
-        },
-    }
+    return Response(request.app.state.health_json, media_type="application/json")
 
 
-@app.get(f"{settings.api_prefix}/health", tags=["Health"])
-async def api_health_check() -> dict[str, str]:
+async def api_health_check(request: Request) -> Response:
     """API v1 health check endpoint."""
-    return {
-        "status": "healthy",
-        "api_version": "v1",
-    }
+    return Response(request.app.state.api_health_json, media_type="application/json")
 
 
-# ===========================================
-# API Router Registration
-# ===========================================
+def create_app() -> FastAPI:
+    """
+    Build the FastAPI application from the current settings.
 
-# Register v1 API router with prefix
-app.include_router(api_router, prefix=settings.api_prefix)
+    App-wide options (docs URLs, CORS, API prefix) are fixed when the app
+    is built, so call this again after ``set_settings()`` to apply them.
+    """
+    settings = get_settings()
+
+    app = FastAPI(
+        title=settings.app_name,
+        description=(
+            "LLM-Powered PDF Intelligence Extraction System. "
+            "Extract structured data from invoices, resumes, and more."
+        ),
+        version=settings.app_version,
+        docs_url="/docs" if settings.debug else None,
+        redoc_url="/redoc" if settings.debug else None,
+        openapi_url="/openapi.json" if settings.debug else None,
+        exception_handlers=EXCEPTION_HANDLERS,
+        lifespan=lifespan,
+    )
+
+    # Available without the lifespan running, e.g. in a plain TestClient(app)
+    _render_static_payloads(app)
+
+    # Configure CORS
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.cors_origins_list,
+        allow_credentials=True,
+        allow_methods=settings.cors_allow_methods_list,
+        allow_headers=settings.cors_allow_headers_list,
+    )
+
+    app.add_api_route("/", root, methods=["GET"], tags=["Root"])
+    app.add_api_route("/health", health_check, methods=["GET"], tags=["Health"])
+    app.add_api_route(
+        f"{settings.api_prefix}/health",
+        api_health_check,
+        methods=["GET"],
+        tags=["Health"],
+    )
+
+    # Register v1 API router with prefix
+    app.include_router(api_router, prefix=settings.api_prefix)
+
+    return app
+
+
+app = create_app()
 
 
 if __name__ == "__main__":
     import uvicorn
 
+    # uvloop is not available on Windows; fall back to the stdlib loop there
+    try:
+        import uvloop  # noqa: F401
+
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
+
+    settings = get_settings()
     uvicorn.run(
         "app.main:app",
         host=settings.api_host,
         port=settings.api_port,
         reload=settings.debug,
+        loop=loop,
+        http="httptools",
+        access_log=False,
+        log_config=None,
     )
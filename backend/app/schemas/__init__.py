@@ -58,6 +58,7 @@ from app.schemas.resume import (
     ProjectItem,
     Resume,
     ResumeData,
+    validate_resumes,
 )
 
 __all__ = [
@@ -94,6 +95,7 @@ __all__ = [
     "ProjectItem",
     "Resume",
     "ResumeData",
+    "validate_resumes",
     # ATS schemas
     "ATSScoreResult",
     "JobDescriptionData",
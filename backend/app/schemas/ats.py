@@ -5,9 +5,11 @@ Defines models for job description analysis, keyword matching,
 and ATS compatibility scoring.
 """
 
-from typing import Any
+import sys
+from dataclasses import dataclass
+from typing import Annotated, Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, SkipValidation, field_validator
 
 
 class JobDescriptionData(BaseModel):
@@ -61,21 +63,38 @@ class JobDescriptionData(BaseModel):
     # Salary if mentioned
     salary_range: str | None = Field(None)
 
+    @field_validator("required_skills", "preferred_skills", "keywords", mode="after")
+    @classmethod
+    def intern_skill_names(cls, v: list[str]) -> list[str]:
+        """Intern skill names so repeated names share one string object."""
+        return [sys.intern(s) for s in v]
 
-class SkillMatch(BaseModel):
-    """A single skill match result."""
 
-    skill: str = Field(..., description="The skill name")
-    found_in_resume: bool = Field(..., description="Whether skill was found")
-    match_type: str = Field("exact", description="exact, partial, or synonym")
-    resume_evidence: str | None = Field(
-        None, description="Where in resume it was found"
-    )
+@dataclass(slots=True, frozen=True)
+class SkillMatch:
+    """
+    A single skill match result.
+
+    Built once per JD skill while scoring, so this is a plain slotted
+    dataclass; pydantic still validates and serializes it as part of
+    ATSScoreResult.
+    """
+
+    skill: Annotated[str, Field(description="The skill name")]
+    found_in_resume: Annotated[bool, Field(description="Whether skill was found")]
+    match_type: Annotated[
+        str, Field(description="exact, partial, synonym, or fuzzy")
+    ] = "exact"
+    resume_evidence: Annotated[
+        str | None, Field(description="Where in resume it was found")
+    ] = None
 
 
 class ATSScoreResult(BaseModel):
     """ATS compatibility score result."""
 
+    model_config = ConfigDict(frozen=True)
+
     ats_score: int = Field(..., ge=0, le=100, description="ATS score 0-100")
 
     # Breakdown
@@ -128,8 +147,9 @@ class ResumeJDAnalysisResult(BaseModel):
     ats_result: ATSScoreResult | None = None
 
     # Full extracted data
-    resume_data: dict[str, Any] = Field(default_factory=dict)
-    jd_data: dict[str, Any] = Field(default_factory=dict)
+    # Already-parsed LLM output; skip re-validating the nested blobs
+    resume_data: SkipValidation[dict[str, Any]] = Field(default_factory=dict)
+    jd_data: SkipValidation[dict[str, Any]] = Field(default_factory=dict)
 
     # Processing info
     processing_time_ms: float = 0
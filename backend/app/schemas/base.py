@@ -5,13 +5,36 @@ Provides common base classes, field confidence enums, and
 validation utilities used across all document schemas.
 """
 
-from datetime import date, datetime
+import re
+from datetime import date, datetime, timezone
 from enum import Enum
-from typing import Any, Optional
+from functools import cache
+from typing import Any, Optional, get_args, get_origin
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
+# Currency symbols and ISO codes stripped before parsing amounts
+_CURRENCY_RE = re.compile(r"[$€£¥₹]|\b(?:USD|EUR|GBP|INR|JPY)\b", re.IGNORECASE)
+
+# Date shapes mapped to the strptime formats that can parse them, in
+# priority order (ambiguous numeric shapes try month-first)
+_DATE_SHAPES: list[tuple[re.Pattern[str], tuple[str, ...]]] = [
+    # 2024-03-15
+    (re.compile(r"\d{4}-\d{1,2}-\d{1,2}"), ("%Y-%m-%d",)),
+    # 03/15/2024, 15/03/2024
+    (re.compile(r"\d{1,2}/\d{1,2}/\d{4}"), ("%m/%d/%Y", "%d/%m/%Y")),
+    # March 15, 2024 / Mar 15, 2024
+    (re.compile(r"[A-Za-z]+\s+\d{1,2},\s*\d{4}"), ("%B %d, %Y", "%b %d, %Y")),
+    # 15 March 2024 / 15 Mar 2024
+    (re.compile(r"\d{1,2}\s+[A-Za-z]+\s+\d{4}"), ("%d %B %Y", "%d %b %Y")),
+    # 2024/03/15
+    (re.compile(r"\d{4}/\d{1,2}/\d{1,2}"), ("%Y/%m/%d",)),
+    # 15-03-2024, 03-15-2024
+    (re.compile(r"\d{1,2}-\d{1,2}-\d{4}"), ("%d-%m-%Y", "%m-%d-%Y")),
+]
+
+
 class FieldConfidence(str, Enum):
     """Confidence level for extracted field values."""
 
@@ -69,6 +92,68 @@ class BaseExtractedData(BaseModel):
         """Get confidence level enum from score."""
         return FieldConfidence.from_score(self.extraction_confidence)
 
+    def dump_public(self) -> dict[str, Any]:
+        """
+        Dump the model without its per-field ``*_confidence`` levels.
+
+        Confidences on nested extracted-data models are dropped as well.
+        Use this where the confidences are not returned, e.g. for storage.
+        """
+        return self.model_dump(exclude=_confidence_exclude(type(self)))
+
+
+@cache
+def _confidence_fields(model: type[BaseExtractedData]) -> tuple[str, ...]:
+    """Find the fields of a model that have a ``<name>_confidence`` companion."""
+    suffix = "_confidence"
+    return tuple(
+        name[: -len(suffix)]
+        for name, field in model.model_fields.items()
+        if name.endswith(suffix) and field.annotation is FieldConfidence
+    )
+
+
+@cache
+def _confidence_exclude(model: type[BaseExtractedData]) -> dict[str, Any]:
+    """Build the model_dump() exclude spec for a model's confidence fields."""
+    exclude: dict[str, Any] = {
+        f"{name}_confidence": True for name in _confidence_fields(model)
+    }
+    for name, nested in _nested_models(model).items():
+        nested_exclude = _confidence_exclude(nested)
+        if not nested_exclude:
+            continue
+        annotation = model.model_fields[name].annotation
+        # list[Item] and Optional[list[Item]] exclude from every element
+        if any(get_origin(arg) is list for arg in (annotation, *get_args(annotation))):
+            nested_exclude = {"__all__": nested_exclude}
+        exclude[name] = nested_exclude
+    return exclude
+
+
+@cache
+def _nested_models(
+    model: type[BaseExtractedData],
+) -> dict[str, type[BaseExtractedData]]:
+    """Map each field holding extracted-data models to that model class."""
+    nested: dict[str, type[BaseExtractedData]] = {}
+    for name, field in model.model_fields.items():
+        nested_model = _extracted_model_in(field.annotation)
+        if nested_model is not None:
+            nested[name] = nested_model
+    return nested
+
+
+def _extracted_model_in(annotation: Any) -> type[BaseExtractedData] | None:
+    """Find the BaseExtractedData subclass in a (possibly wrapped) annotation."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseExtractedData):
+        return annotation
+    for arg in get_args(annotation):
+        model = _extracted_model_in(arg)
+        if model is not None:
+            return model
+    return None
+
 
 class FieldScore(BaseModel):
     """Confidence score and metadata for a single extracted field."""
@@ -123,6 +208,11 @@ class ValidationResult(BaseModel):
     )
 
 
+def utc_now() -> datetime:
+    """Get the current time as a timezone-aware UTC datetime."""
+    return datetime.now(timezone.utc)
+
+
 def parse_date(value: Any) -> Optional[date]:
     """
     Parse various date formats into a date object.
@@ -149,25 +239,16 @@ def parse_date(value: Any) -> Optional[date]:
     if not value:
         return None
 
-    # Common date formats to try
-    formats = [
-        "%Y-%m-%d",  # 2024-03-15
-        "%m/%d/%Y",  # 03/15/2024
-        "%d/%m/%Y",  # 15/03/2024
-        "%B %d, %Y",  # March 15, 2024
-        "%b %d, %Y",  # Mar 15, 2024
-        "%d %B %Y",  # 15 March 2024
-        "%d %b %Y",  # 15 Mar 2024
-        "%Y/%m/%d",  # 2024/03/15
-        "%d-%m-%Y",  # 15-03-2024
-        "%m-%d-%Y",  # 03-15-2024
-    ]
-
-    for fmt in formats:
-        try:
-            return datetime.strptime(value, fmt).date()
-        except ValueError:
+    # Only try the formats whose shape matches the value
+    for shape, formats in _DATE_SHAPES:
+        if not shape.fullmatch(value):
             continue
+        for fmt in formats:
+            try:
+                return datetime.strptime(value, fmt).date()
+            except ValueError:
+                continue
+        return None
 
     return None
 
@@ -181,8 +262,6 @@ def parse_amount(value: Any) -> Optional[float]:
     - With currency: $1,500.00, €1.500,00
     - With symbols: 1,500.00 USD
     """
-    import re
-
     if value is None:
         return None
 
@@ -196,11 +275,12 @@ def parse_amount(value: Any) -> Optional[float]:
     if not value:
         return None
 
-    # Remove currency symbols
-    value = re.sub(r"[$€£¥₹]", "", value)
-    # Remove currency codes
-    value = re.sub(r"\b(USD|EUR|GBP|INR|JPY)\b", "", value, flags=re.IGNORECASE)
-    value = value.strip()
+    # Plain integers need no cleanup
+    if value.isdecimal():
+        return float(value)
+
+    # Remove currency symbols and codes
+    value = _CURRENCY_RE.sub("", value).strip()
 
     # Handle different decimal separators
     if "." in value and "," in value:
@@ -4,10 +4,11 @@ Candidate fit scoring and red flag detection schemas.
 Defines models for candidate analysis, red flags, and recommendations.
 """
 
+from dataclasses import dataclass
 from enum import Enum
-from typing import Any
+from typing import Annotated, Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, SkipValidation
 
 
 class RedFlagSeverity(str, Enum):
@@ -48,6 +49,8 @@ class RecommendationType(str, Enum):
 class RedFlag(BaseModel):
     """A detected red flag in a candidate's resume."""
 
+    model_config = ConfigDict(frozen=True)
+
     flag_type: RedFlagType = Field(..., description="Type of red flag")
     severity: RedFlagSeverity = Field(..., description="Severity level")
     title: str = Field(..., description="Short title for the flag")
@@ -59,6 +62,8 @@ class RedFlag(BaseModel):
 class StrengthItem(BaseModel):
     """A strength identified in the candidate."""
 
+    model_config = ConfigDict(frozen=True)
+
     category: str = Field(
         ..., description="Category (skills, experience, education, etc.)"
     )
@@ -72,6 +77,8 @@ class StrengthItem(BaseModel):
 class CareerProgression(BaseModel):
     """Analysis of career progression."""
 
+    model_config = ConfigDict(frozen=True)
+
     trajectory: str = Field(..., description="upward, lateral, downward, or mixed")
     avg_tenure_months: float = Field(..., description="Average job tenure in months")
     longest_tenure_months: int = Field(..., description="Longest tenure at one company")
@@ -83,6 +90,8 @@ class CareerProgression(BaseModel):
 class FitScoreBreakdown(BaseModel):
     """Breakdown of the fit score components."""
 
+    model_config = ConfigDict(frozen=True)
+
     skills_alignment: int = Field(..., ge=0, le=100)
     experience_match: int = Field(..., ge=0, le=100)
     education_fit: int = Field(..., ge=0, le=100)
@@ -157,29 +166,37 @@ class FullCandidateAnalysis(BaseModel):
     fit_analysis: CandidateFitResult | None = None
 
     # Full data
-    resume_data: dict[str, Any] = Field(default_factory=dict)
-    jd_data: dict[str, Any] = Field(default_factory=dict)
+    # Already-parsed LLM output; skip re-validating the nested blobs
+    resume_data: SkipValidation[dict[str, Any]] = Field(default_factory=dict)
+    jd_data: SkipValidation[dict[str, Any]] = Field(default_factory=dict)
 
     # Processing
     processing_time_ms: float = 0
     error: str | None = None
 
 
-class CandidateRankingScore(BaseModel):
-    """Individual candidate ranking score."""
+@dataclass(slots=True)
+class CandidateRankingScore:
+    """
+    Individual candidate ranking score.
 
-    rank: int = Field(..., description="Ranking position (1 = best)")
-    file_name: str = Field(..., description="Name of the resume file")
-    candidate_name: str | None = Field(None)
-    overall_score: int = Field(..., ge=0, le=100)
-    ats_score: int = Field(..., ge=0, le=100)
-    fit_score: int = Field(..., ge=0, le=100)
-    recommendation: RecommendationType = Field(...)
-    strengths_count: int = Field(default=0)
-    red_flags_count: int = Field(default=0)
-    has_critical_red_flags: bool = Field(False)
-    suggested_level: str | None = Field(None)
-    executive_summary: str | None = Field(None)
+    A plain slotted dataclass since one is built per candidate and its
+    rank is assigned after sorting; pydantic validates it when it is
+    placed in a RankingResult.
+    """
+
+    rank: Annotated[int, Field(description="Ranking position (1 = best)")]
+    file_name: Annotated[str, Field(description="Name of the resume file")]
+    candidate_name: str | None
+    overall_score: Annotated[int, Field(ge=0, le=100)]
+    ats_score: Annotated[int, Field(ge=0, le=100)]
+    fit_score: Annotated[int, Field(ge=0, le=100)]
+    recommendation: RecommendationType
+    strengths_count: int = 0
+    red_flags_count: int = 0
+    has_critical_red_flags: bool = False
+    suggested_level: str | None = None
+    executive_summary: str | None = None
 
 
 class CandidateComparison(BaseModel):
@@ -242,8 +259,8 @@ class RankingResult(BaseModel):
     top_candidate: CandidateRankingScore | None = None
     top_candidate_analysis: FullCandidateAnalysis | None = None
 
-    # Full analyses
-    all_analyses: dict[str, FullCandidateAnalysis] = Field(
+    # Full analyses (built by the ranker; stored by reference, not re-checked)
+    all_analyses: SkipValidation[dict[str, FullCandidateAnalysis]] = Field(
         default_factory=dict,
         description="Full analysis for each candidate (keyed by file name)",
     )
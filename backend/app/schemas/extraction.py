@@ -5,13 +5,19 @@ This module defines the API response schemas for extraction operations,
 including extraction results, metadata, and validation summaries.
 """
 
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any, Optional, Union
+from typing import Annotated, Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, computed_field
 
-from app.schemas.base import FieldScore, ValidationResult, ValidationSeverity
+from app.schemas.base import (
+    FieldScore,
+    ValidationResult,
+    ValidationSeverity,
+    utc_now,
+)
 from app.schemas.invoice import InvoiceData
 
 
@@ -26,6 +32,17 @@ class DocumentType(str, Enum):
     GENERIC = "generic"
     UNKNOWN = "unknown"
 
+    @classmethod
+    def from_value(cls, value: Optional[str]) -> "DocumentType":
+        """Look up a document type by value, falling back to UNKNOWN."""
+        return _DOCUMENT_TYPES_BY_VALUE.get(value, cls.UNKNOWN)
+
+
+# Built once; members are shared singletons keyed by their interned values
+_DOCUMENT_TYPES_BY_VALUE: dict[Optional[str], DocumentType] = {
+    member.value: member for member in DocumentType
+}
+
 
 class ExtractionStatus(str, Enum):
     """Status of extraction operation."""
@@ -103,37 +120,35 @@ class ExtractionMetrics(BaseModel):
         }
 
 
-class PageInfo(BaseModel):
-    """Information about a processed page."""
+@dataclass(slots=True, frozen=True)
+class PageInfo:
+    """
+    Information about a processed page.
 
-    page_number: int = Field(
-        ...,
-        ge=1,
-        description="Page number (1-indexed)",
-    )
-    char_count: int = Field(
-        default=0,
-        ge=0,
-        description="Number of characters extracted from page",
-    )
-    word_count: int = Field(
-        default=0,
-        ge=0,
-        description="Number of words extracted from page",
-    )
-    has_tables: bool = Field(
-        default=False,
-        description="Whether page contains tables",
+    One is built per page, so this is a plain slotted dataclass; pydantic
+    still validates and serializes it as part of DocumentMetadata.
+    """
+
+    page_number: Annotated[int, Field(ge=1, description="Page number (1-indexed)")]
+    char_count: Annotated[
+        int, Field(ge=0, description="Number of characters extracted from page")
+    ] = 0
+    word_count: Annotated[
+        int, Field(ge=0, description="Number of words extracted from page")
+    ] = 0
+    has_tables: Annotated[bool, Field(description="Whether page contains tables")] = (
+        False
     )
-    has_images: bool = Field(
-        default=False,
-        description="Whether page contains images",
+    has_images: Annotated[bool, Field(description="Whether page contains images")] = (
+        False
     )
 
 
 class DocumentMetadata(BaseModel):
     """Metadata about the processed document."""
 
+    model_config = ConfigDict(defer_build=True)
+
     filename: str = Field(
         ...,
         description="Original filename",
@@ -181,6 +196,8 @@ class DocumentMetadata(BaseModel):
 class ValidationSummary(BaseModel):
     """Summary of validation results."""
 
+    model_config = ConfigDict(defer_build=True)
+
     is_valid: bool = Field(
         ...,
         description="Whether the extraction passed validation",
@@ -227,6 +244,19 @@ class ValidationSummary(BaseModel):
             return 0.0
         return self.fields_extracted / self.fields_expected
 
+    @property
+    def issues_by_severity(self) -> dict[ValidationSeverity, list[ValidationResult]]:
+        """
+        Issues bucketed by severity level.
+
+        Built in one pass on each access, so callers that need every level
+        should read this once rather than filter per severity.
+        """
+        buckets: dict[ValidationSeverity, list[ValidationResult]] = {}
+        for issue in self.issues:
+            buckets.setdefault(issue.severity, []).append(issue)
+        return buckets
+
     def get_issues_by_severity(
         self, severity: ValidationSeverity
     ) -> list[ValidationResult]:
@@ -272,7 +302,7 @@ class ExtractionResponse(BaseModel):
         description="Unique request identifier",
     )
     timestamp: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=utc_now,
         description="Timestamp of extraction",
     )
 
@@ -292,8 +322,9 @@ class ExtractionResponse(BaseModel):
         description="Document metadata",
     )
 
-    # Extracted data (union of all document types)
-    extracted_data: Optional[Union[InvoiceData, dict[str, Any]]] = Field(
+    # Extracted data, as a plain dict for every document type; use
+    # as_invoice() for a typed view
+    extracted_data: Optional[dict[str, Any]] = Field(
         default=None,
         description="Extracted structured data",
     )
@@ -328,10 +359,9 @@ class ExtractionResponse(BaseModel):
         description="Non-fatal warnings during extraction",
     )
 
-    class Config:
-        """Pydantic model configuration."""
-
-        json_schema_extra = {
+    model_config = ConfigDict(
+        defer_build=True,
+        json_schema_extra={
             "example": {
                 "request_id": "req_abc123",
                 "timestamp": "2024-01-15T10:30:00Z",
@@ -358,7 +388,8 @@ class ExtractionResponse(BaseModel):
                     "tokens_per_second": 11.3,
                 },
             }
-        }
+        },
+    )
 
     def is_successful(self) -> bool:
         """Check if extraction was successful."""
@@ -368,6 +399,12 @@ class ExtractionResponse(BaseModel):
         """Check if there are critical validation issues."""
         return self.validation is not None and self.validation.critical_issues > 0
 
+    def as_invoice(self) -> Optional[InvoiceData]:
+        """Validate the extracted data as an invoice, if there is any."""
+        if self.extracted_data is None:
+            return None
+        return InvoiceData.model_validate(self.extracted_data)
+
 
 class BatchExtractionRequest(BaseModel):
     """Request schema for batch extraction."""
@@ -393,6 +430,8 @@ class BatchExtractionRequest(BaseModel):
 class BatchExtractionResponse(BaseModel):
     """Response schema for batch extraction."""
 
+    model_config = ConfigDict(defer_build=True)
+
     batch_id: str = Field(
         ...,
         description="Unique batch identifier",
@@ -417,6 +456,11 @@ class BatchExtractionResponse(BaseModel):
         ge=0,
         description="Number of failed extractions",
     )
+    total_time: float = Field(
+        default=0.0,
+        ge=0,
+        description="Total batch processing time in seconds",
+    )
     results: list[ExtractionResponse] = Field(
         default_factory=list,
         description="Individual extraction results",
@@ -434,16 +478,18 @@ class BatchExtractionResponse(BaseModel):
         description="Batch completion timestamp",
     )
 
+    # Computed fields are included in the dump, so pollers read them from
+    # the response instead of deriving them client-side
+
+    @computed_field
     @property
     def progress_percentage(self) -> float:
         """Calculate batch processing progress."""
-        if self.total_files == 0:
-            return 0.0
-        return (self.processed / self.total_files) * 100
+        return self.processed * 100 / max(self.total_files, 1)
 
+    @computed_field
     @property
     def success_rate(self) -> float:
         """Calculate success rate for completed extractions."""
-        if self.processed == 0:
-            return 0.0
-        return self.successful / self.processed
+        # successful never exceeds processed, so this is 0.0 when nothing ran
+        return self.successful / max(self.processed, 1)
@@ -8,12 +8,27 @@ including line items, totals, and confidence scoring for each field.
 import re
 from datetime import date
 from decimal import Decimal
-from typing import Optional
+from math import isfinite
+from typing import Annotated, Optional
 
-from pydantic import Field, field_validator, model_validator
+from pydantic import ConfigDict, Field, field_validator, model_validator
 
 from app.schemas.base import BaseExtractedData, FieldConfidence
 
+# Percent signs and whitespace stripped before parsing percentages
+_PERCENT_NOISE_RE = re.compile(r"[%\s]+")
+
+# Constrained types shared by the monetary and percentage fields, so each
+# constraint set is declared (and its metadata built) once
+_Amount = Annotated[Decimal, Field(ge=0)]
+_Percent = Annotated[float, Field(ge=0, le=100)]
+
+# Shared Decimal constants; Decimals are immutable, so one instance is reused
+# instead of constructing a new one per validation
+_ZERO = Decimal(0)
+# Rounding tolerance for monetary consistency checks
+_CENT_TOLERANCE = Decimal("0.01")
+
 
 def parse_percentage(value) -> Optional[float]:
     """Parse percentage values like '16%', '8.25%', '16' into floats."""
@@ -22,10 +37,15 @@ def parse_percentage(value) -> Optional[float]:
     if isinstance(value, (int, float)):
         return float(value)
     if isinstance(value, str):
+        # Plain numbers need no cleanup
+        if "%" not in value:
+            try:
+                return float(value)
+            except ValueError:
+                pass
         # Remove % sign and any whitespace
-        cleaned = re.sub(r"[%\s]", "", value)
         try:
-            return float(cleaned)
+            return float(_PERCENT_NOISE_RE.sub("", value))
         except ValueError:
             return None
     return None
@@ -34,6 +54,9 @@ def parse_percentage(value) -> Optional[float]:
 class LineItem(BaseExtractedData):
     """Model for invoice line items."""
 
+    # Validators set confidences on self; skip re-validating those writes
+    model_config = ConfigDict(defer_build=True, validate_assignment=False)
+
     description: Optional[str] = Field(
         default=None,
         description="Description of the item or service",
@@ -43,9 +66,8 @@ class LineItem(BaseExtractedData):
         ge=0,
         description="Quantity of items",
     )
-    unit_price: Optional[Decimal] = Field(
+    unit_price: Optional[_Amount] = Field(
         default=None,
-        ge=0,
         description="Price per unit",
     )
     amount: Optional[Decimal] = Field(
@@ -60,10 +82,8 @@ class LineItem(BaseExtractedData):
         default=None,
         description="Unit of measurement (e.g., 'each', 'hour', 'kg')",
     )
-    tax_rate: Optional[float] = Field(
+    tax_rate: Optional[_Percent] = Field(
         default=None,
-        ge=0,
-        le=100,
         description="Tax rate percentage for this item",
     )
 
@@ -90,24 +110,32 @@ class LineItem(BaseExtractedData):
         description="Confidence score for amount field",
     )
 
+    def amount_is_consistent(self) -> bool:
+        """
+        Check that amount matches quantity * unit_price.
+
+        Callers must ensure quantity, unit_price and amount are all set.
+        """
+        quantity = self.quantity
+        # Whole quantities (the common case) multiply exactly as ints
+        if float(quantity).is_integer():
+            expected = int(quantity) * self.unit_price
+        else:
+            expected = Decimal(str(quantity)) * self.unit_price
+        # Allow small tolerance for rounding
+        return abs(self.amount - expected) <= _CENT_TOLERANCE
+
     @model_validator(mode="after")
     def validate_line_item_consistency(self) -> "LineItem":
         """Validate line item amount matches quantity * unit_price."""
-        try:
-            if (
-                self.quantity is not None
-                and self.unit_price is not None
-                and self.amount is not None
-            ):
-                expected = Decimal(str(self.quantity)) * self.unit_price
-                # Allow small tolerance for rounding
-                tolerance = Decimal("0.01")
-                if abs(self.amount - expected) > tolerance:
-                    # Don't fail, but mark as potentially inconsistent
-                    self.amount_confidence = FieldConfidence.LOW
-        except (ValueError, TypeError, RecursionError):
-            # Skip validation on error
-            pass
+        if self.quantity is None or self.unit_price is None or self.amount is None:
+            return self
+        # Infinite quantities cannot be checked (inf * 0 is undefined)
+        if not isfinite(self.quantity):
+            return self
+        if not self.amount_is_consistent():
+            # Don't fail, but mark as potentially inconsistent
+            self.amount_confidence = FieldConfidence.LOW
         return self
 
 
@@ -232,6 +260,9 @@ class InvoiceData(BaseExtractedData):
     containing all relevant invoice information with confidence scores.
     """
 
+    # Validators set confidences on self; skip re-validating those writes
+    model_config = ConfigDict(defer_build=True, validate_assignment=False)
+
     # Core invoice identifiers
     invoice_number: Optional[str] = Field(
         default=None,
@@ -263,20 +294,16 @@ class InvoiceData(BaseExtractedData):
     )
 
     # Financial totals
-    subtotal: Optional[Decimal] = Field(
+    subtotal: Optional[_Amount] = Field(
         default=None,
-        ge=0,
         description="Subtotal before tax and discounts",
     )
-    tax_amount: Optional[Decimal] = Field(
+    tax_amount: Optional[_Amount] = Field(
         default=None,
-        ge=0,
         description="Total tax amount",
     )
-    tax_rate: Optional[float] = Field(
+    tax_rate: Optional[_Percent] = Field(
         default=None,
-        ge=0,
-        le=100,
         description="Overall tax rate percentage",
     )
 
@@ -285,25 +312,20 @@ class InvoiceData(BaseExtractedData):
     def parse_percentage_fields(cls, v):
         return parse_percentage(v)
 
-    discount_amount: Optional[Decimal] = Field(
+    discount_amount: Optional[_Amount] = Field(
         default=None,
-        ge=0,
         description="Total discount amount",
     )
-    discount_percentage: Optional[float] = Field(
+    discount_percentage: Optional[_Percent] = Field(
         default=None,
-        ge=0,
-        le=100,
         description="Discount percentage",
     )
-    shipping_amount: Optional[Decimal] = Field(
+    shipping_amount: Optional[_Amount] = Field(
         default=None,
-        ge=0,
         description="Shipping/handling charges",
     )
-    total_amount: Optional[Decimal] = Field(
+    total_amount: Optional[_Amount] = Field(
         default=None,
-        ge=0,
         description="Total invoice amount",
     )
     currency: Optional[str] = Field(
@@ -315,9 +337,8 @@ class InvoiceData(BaseExtractedData):
         default=None,
         description="Amount currently due",
     )
-    amount_paid: Optional[Decimal] = Field(
+    amount_paid: Optional[_Amount] = Field(
         default=None,
-        ge=0,
         description="Amount already paid",
     )
 
@@ -370,43 +391,38 @@ class InvoiceData(BaseExtractedData):
     @model_validator(mode="after")
     def validate_totals_consistency(self) -> "InvoiceData":
         """Validate that invoice totals are mathematically consistent."""
-        try:
-            # Check if line items sum to subtotal
-            if self.line_items and self.subtotal is not None:
-                items_total = sum(
-                    item.amount for item in self.line_items if item.amount is not None
-                )
-                if items_total > 0:
-                    tolerance = Decimal("0.01")
-                    if abs(self.subtotal - items_total) > tolerance:
-                        # Mark subtotal confidence as low if mismatch
-                        self.subtotal_confidence = FieldConfidence.LOW
-
-            # Check if subtotal + tax - discount = total
-            if self.subtotal is not None and self.total_amount is not None:
-                calculated_total = self.subtotal
-                if self.tax_amount is not None:
-                    calculated_total += self.tax_amount
-                if self.discount_amount is not None:
-                    calculated_total -= self.discount_amount
-                if self.shipping_amount is not None:
-                    calculated_total += self.shipping_amount
-
-                tolerance = Decimal("0.01")
-                if abs(self.total_amount - calculated_total) > tolerance:
-                    # Don't fail, but could affect confidence
-                    pass
-        except (ValueError, TypeError, RecursionError):
-            # Skip validation on error
-            pass
+        # Check if line items sum to subtotal
+        if self.line_items and self.subtotal is not None:
+            items_total = self.get_line_items_total()
+            if items_total > 0:
+                if abs(self.subtotal - items_total) > _CENT_TOLERANCE:
+                    # Mark subtotal confidence as low if mismatch
+                    self.subtotal_confidence = FieldConfidence.LOW
+
+        # Check if subtotal + tax - discount = total
+        if self.subtotal is not None and self.total_amount is not None:
+            calculated_total = self.subtotal
+            if self.tax_amount is not None:
+                calculated_total += self.tax_amount
+            if self.discount_amount is not None:
+                calculated_total -= self.discount_amount
+            if self.shipping_amount is not None:
+                calculated_total += self.shipping_amount
+
+            if abs(self.total_amount - calculated_total) > _CENT_TOLERANCE:
+                # Don't fail, but could affect confidence
+                pass
 
         return self
 
     def get_line_items_total(self) -> Decimal:
         """Calculate total from line items."""
-        return sum(
-            item.amount for item in self.line_items if item.amount is not None
-        ) or Decimal("0")
+        total = _ZERO
+        for item in self.line_items:
+            amount = item.amount
+            if amount is not None:
+                total += amount
+        return total
 
     def get_field_summary(self) -> dict[str, bool]:
         """Get summary of which fields were extracted."""
@@ -7,12 +7,18 @@ Designed for production-grade HR/recruitment intelligence.
 """
 
 import re
+from functools import cache
 from typing import Optional
 
-from pydantic import Field, field_validator, model_validator
+from pydantic import ConfigDict, Field, TypeAdapter, field_validator, model_validator
 
 from app.schemas.base import BaseExtractedData, FieldConfidence
 
+# Basic email shape check applied by ResumeData.validate_email
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+# Prefixes that mark a profile URL as already having a scheme
+_URL_SCHEMES = ("http://", "https://")
+
 
 class ExperienceItem(BaseExtractedData):
     """Model for work experience entries."""
@@ -182,6 +188,9 @@ class ResumeData(BaseExtractedData):
     Designed for HR/recruitment intelligence and ATS compatibility.
     """
 
+    # Validators set derived fields on self; skip re-validating those writes
+    model_config = ConfigDict(defer_build=True, validate_assignment=False)
+
     # =========================================================================
     # Personal Information
     # =========================================================================
@@ -352,9 +361,12 @@ class ResumeData(BaseExtractedData):
         """Validate and normalize email."""
         if v is None:
             return None
-        v = v.strip().lower()
+        # Whitespace is already stripped (str_strip_whitespace), and emails
+        # usually arrive lowercase, so only lower() when needed
+        if not v.islower():
+            v = v.lower()
         # Basic email pattern check
-        if v and not re.match(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$", v):
+        if v and not _EMAIL_RE.match(v):
             return None  # Invalid email, set to None
         return v
 
@@ -366,7 +378,7 @@ class ResumeData(BaseExtractedData):
             return None
         v = v.strip()
         # Add https if missing
-        if v and not v.startswith(("http://", "https://")):
+        if v and not v.startswith(_URL_SCHEMES):
             v = "https://" + v
         return v
 
@@ -377,38 +389,39 @@ class ResumeData(BaseExtractedData):
         if v is None:
             return []
         if isinstance(v, str):
-            # Split by common delimiters
-            return [s.strip() for s in re.split(r"[,;|]", v) if s.strip()]
+            # Split by common delimiters (, ; |); folding them into commas
+            # with str.replace is faster than a regex split
+            parts = v.replace(";", ",").replace("|", ",").split(",")
+            return [s.strip() for s in parts if s.strip()]
         return v
 
     @model_validator(mode="after")
-    def infer_current_position(self) -> "ResumeData":
-        """Infer current role/company from experience if not set."""
-        try:
-            if self.experience and len(self.experience) > 0:
-                # Get the most recent (first) experience
-                latest = self.experience[0]
-                if not self.current_role and latest.role:
-                    self.current_role = latest.role
-                if not self.current_company and latest.company:
-                    self.current_company = latest.company
-        except (IndexError, AttributeError):
-            pass
-        return self
-
-    @model_validator(mode="after")
-    def calculate_total_experience(self) -> "ResumeData":
-        """Calculate total experience from individual positions."""
-        try:
-            if self.total_experience_years is None and self.experience:
-                total_months = 0
-                for exp in self.experience:
-                    if exp.duration_months:
-                        total_months += exp.duration_months
-                if total_months > 0:
-                    self.total_experience_years = round(total_months / 12, 1)
-        except Exception:
-            pass
+    def derive_experience_fields(self) -> "ResumeData":
+        """
+        Fill current role/company and total experience from experience.
+
+        Current position comes from the most recent (first) entry; total
+        experience is only calculated when not given explicitly.
+        """
+        if not self.experience:
+            return self
+        latest = self.experience[0]
+        if not self.current_role and latest.role:
+            self.current_role = latest.role
+        if not self.current_company and latest.company:
+            self.current_company = latest.company
+        if self.total_experience_years is None:
+            total_months = 0
+            for exp in self.experience:
+                if exp.duration_months:
+                    total_months += exp.duration_months
+            if total_months > 0:
+                # Years to one decimal in integer tenths, rounding half to
+                # even so results match round(total_months / 12, 1)
+                tenths, rem = divmod(total_months * 10, 12)
+                if rem > 6 or (rem == 6 and tenths % 2):
+                    tenths += 1
+                self.total_experience_years = tenths / 10
         return self
 
     def get_field_summary(self) -> dict[str, bool]:
@@ -428,8 +441,7 @@ class ResumeData(BaseExtractedData):
 
     def get_skills_count(self) -> int:
         """Get total number of unique skills."""
-        all_skills = set(self.skills + self.technical_skills + self.soft_skills)
-        return len(all_skills)
+        return len({*self.skills, *self.technical_skills, *self.soft_skills})
 
     def get_experience_count(self) -> int:
         """Get number of experience entries."""
@@ -440,5 +452,24 @@ class ResumeData(BaseExtractedData):
         return len(self.education)
 
 
+@cache
+def _resume_list_adapter() -> TypeAdapter[list[ResumeData]]:
+    """Build the list validator on first use, keeping ResumeData deferred."""
+    return TypeAdapter(list[ResumeData])
+
+
+def validate_resumes(raw_resumes: list[dict]) -> list[ResumeData]:
+    """
+    Validate a batch of raw resume dicts in a single pydantic-core call.
+
+    Args:
+        raw_resumes: Resume dicts as extracted from the documents
+
+    Returns:
+        Validated ResumeData instances
+    """
+    return _resume_list_adapter().validate_python(raw_resumes)
+
+
 # Type alias for backward compatibility
 Resume = ResumeData
@@ -6,6 +6,7 @@ Provides keyword matching, skill comparison, and ATS scoring.
 
 from app.services.ats.scorer import (
     ATSAnalyzer,
+    JDContext,
     get_ats_analyzer,
     get_skill_variations,
     normalize_skill,
@@ -14,6 +15,7 @@ from app.services.ats.scorer import (
 
 __all__ = [
     "ATSAnalyzer",
+    "JDContext",
     "get_ats_analyzer",
     "skills_match",
     "normalize_skill",
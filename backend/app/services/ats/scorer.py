@@ -6,12 +6,16 @@ between resumes and job descriptions.
 """
 
 import re
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
-from app.core import logger
+from app.core import get_logger
 from app.schemas.ats import ATSScoreResult, SkillMatch
 
+logger = get_logger()
+
 # Common skill synonyms/variations for fuzzy matching
 SKILL_SYNONYMS: dict[str, list[str]] = {
     "javascript": ["js", "ecmascript", "es6", "es2015"],
@@ -46,32 +50,133 @@ SKILL_SYNONYMS: dict[str, list[str]] = {
 }
 
 
+def _build_synonym_groups() -> dict[str, frozenset[str]]:
+    """Map every skill name and synonym to its whole synonym group."""
+    groups: dict[str, frozenset[str]] = {}
+    for key, synonyms in SKILL_SYNONYMS.items():
+        group = frozenset([key, *synonyms])
+        for term in group:
+            groups[term] = groups.get(term, frozenset()) | group
+    return groups
+
+
+# Inverted SKILL_SYNONYMS, so a skill's variations are one dict lookup
+_SYNONYM_GROUPS = _build_synonym_groups()
+
+# Degree keywords and their level, highest level first
+_DEGREE_LEVELS: tuple[tuple[str, int], ...] = (
+    ("phd", 5),
+    ("doctorate", 5),
+    ("ph.d", 5),
+    ("master", 4),
+    ("msc", 4),
+    ("mba", 4),
+    ("ms", 4),
+    ("bachelor", 3),
+    ("bsc", 3),
+    ("ba", 3),
+    ("bs", 3),
+    ("associate", 2),
+    ("diploma", 1),
+    ("certificate", 1),
+)
+
+# Skill names come from user documents, so the memo caches are bounded
+_SKILL_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=_SKILL_CACHE_SIZE)
 def normalize_skill(skill: str) -> str:
-    """Normalize a skill name for comparison."""
-    return skill.lower().strip().replace("-", " ").replace("_", " ")
+    """
+    Normalize a skill name for comparison.
+
+    The result is interned and memoized: the same few hundred skill
+    names recur in every resume and JD, so they share one string object
+    each and are normalized once.
+    """
+    return sys.intern(skill.lower().strip().replace("-", " ").replace("_", " "))
 
 
-def get_skill_variations(skill: str) -> set[str]:
-    """Get all variations/synonyms of a skill."""
+@lru_cache(maxsize=_SKILL_CACHE_SIZE)
+def get_skill_variations(skill: str) -> frozenset[str]:
+    """
+    Get all variations/synonyms of a skill.
+
+    Memoized, so the result is a frozenset shared between callers.
+    """
     normalized = normalize_skill(skill)
-    variations = {normalized}
+    return _SYNONYM_GROUPS.get(normalized, frozenset((normalized,)))
 
-    # Check if this skill is a key in synonyms
-    if normalized in SKILL_SYNONYMS:
-        variations.update(SKILL_SYNONYMS[normalized])
 
-    # Check if this skill is a value in synonyms
-    for key, synonyms in SKILL_SYNONYMS.items():
-        if normalized in synonyms or normalized == key:
-            variations.add(key)
-            variations.update(synonyms)
+def _degree_level(text: str) -> int:
+    """Get the highest degree level mentioned in lowercased text (0 if none)."""
+    # Levels are ordered highest first, so the first hit is the maximum
+    for key, level in _DEGREE_LEVELS:
+        if key in text:
+            return level
+    return 0
+
+
+def fuzzy_budget(skill1: str, skill2: str) -> int:
+    """
+    Get the maximum edit distance tolerated between two skills.
+
+    Short names are too easy to confuse (``rust``/``rest``,
+    ``scala``/``scale``), so they never match fuzzily; longer names
+    allow one or two typos.
+    """
+    shorter = min(len(skill1), len(skill2))
+    if shorter < 6:
+        return 0
+    if shorter <= 8:
+        return 1
+    return 2
+
+
+def within_edit_distance(s1: str, s2: str, max_cost: int) -> bool:
+    """
+    Check whether the Levenshtein distance of two strings is <= max_cost.
+
+    Bails out as soon as every cell in a DP row exceeds the budget, so
+    clearly different strings cost only a few rows.
+    """
+    if abs(len(s1) - len(s2)) > max_cost:
+        return False
+
+    previous = list(range(len(s2) + 1))
+    for i, c1 in enumerate(s1, 1):
+        current = [i]
+        for j, c2 in enumerate(s2, 1):
+            current.append(
+                min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (c1 != c2),
+                )
+            )
+        if min(current) > max_cost:
+            return False
+        previous = current
+
+    return previous[-1] <= max_cost
+
+
+def fuzzy_match(s1: str, s2: str) -> bool:
+    """
+    Check whether two normalized skills differ only by a typo.
 
-    return variations
+    Known skill names and synonyms are distinct skills, not misspellings
+    of each other, so they never match fuzzily.
+    """
+    if s1 in _SYNONYM_GROUPS or s2 in _SYNONYM_GROUPS:
+        return False
+    max_cost = fuzzy_budget(s1, s2)
+    return max_cost > 0 and within_edit_distance(s1, s2, max_cost)
 
 
 def skills_match(skill1: str, skill2: str) -> tuple[bool, str]:
     """
-    Check if two skills match (exact, partial, or synonym).
+    Check if two skills match (exact, partial, synonym, or fuzzy).
 
     Returns:
         Tuple of (is_match, match_type)
@@ -87,17 +192,97 @@ def skills_match(skill1: str, skill2: str) -> tuple[bool, str]:
     if s1 in s2 or s2 in s1:
         return True, "partial"
 
-    # Synonym match
-    variations1 = get_skill_variations(skill1)
-    variations2 = get_skill_variations(skill2)
-
-    if variations1 & variations2:  # Intersection
+    # Synonym match; a skill outside every synonym group has no synonyms
+    group1 = _SYNONYM_GROUPS.get(s1)
+    group2 = _SYNONYM_GROUPS.get(s2)
+    if group1 is not None and group2 is not None and not group1.isdisjoint(group2):
         return True, "synonym"
 
+    # Fuzzy match (typos and spelling variants, e.g. "tensorflw")
+    if fuzzy_match(s1, s2):
+        return True, "fuzzy"
+
     return False, "none"
 
 
-@dataclass
+def _skill_pattern(terms: set[str]) -> re.Pattern[str]:
+    """
+    Compile a pattern finding any of the given skill terms as whole words.
+
+    Terms are tried longest first, so e.g. "react.js" wins over "react".
+    """
+    return re.compile(
+        r"(?<![\w.+#])(?:"
+        + "|".join(re.escape(t) for t in sorted(terms, key=len, reverse=True) if t)
+        + r")(?![\w+#])"
+    )
+
+
+def _build_variation_index(skills: set[str]) -> dict[str, str]:
+    """Map every synonym/variation of the given skills to the skill itself."""
+    index: dict[str, str] = {}
+    for skill in skills:
+        for variation in get_skill_variations(skill):
+            index.setdefault(variation, skill)
+    return index
+
+
+@dataclass(slots=True, frozen=True)
+class JDContext:
+    """
+    Job description requirements normalized once for scoring.
+
+    Ranking scores many resumes against one JD; building this once and
+    passing it to every calculate_ats_score call avoids re-normalizing
+    the JD skill lists and re-expanding keyword synonyms per candidate.
+    """
+
+    required_skills: tuple[str, ...]
+    preferred_skills: tuple[str, ...]
+    keywords: tuple[str, ...]
+    keyword_variations: dict[str, frozenset[str]]
+    # Known skill names plus the JD's own skills, to find in highlights
+    highlight_skill_re: re.Pattern[str]
+
+    @classmethod
+    def from_jd_data(cls, jd_data: dict[str, Any]) -> "JDContext":
+        """
+        Build the context from extracted job description data.
+
+        Memoized on the JD's skill and keyword lists, so scoring the same
+        JD again (e.g. one resume at a time) reuses the prepared context.
+        """
+        return _build_jd_context(
+            tuple(jd_data.get("required_skills", [])),
+            tuple(jd_data.get("preferred_skills", [])),
+            tuple(jd_data.get("keywords", [])),
+        )
+
+
+@lru_cache(maxsize=256)
+def _build_jd_context(
+    required_skills: tuple[str, ...],
+    preferred_skills: tuple[str, ...],
+    keywords: tuple[str, ...],
+) -> JDContext:
+    """Normalize JD skill lists and expand keyword synonyms."""
+    normalized_keywords = tuple(normalize_skill(k) for k in keywords)
+    normalized_required = tuple(normalize_skill(s) for s in required_skills)
+    normalized_preferred = tuple(normalize_skill(s) for s in preferred_skills)
+    highlight_terms = set(_SYNONYM_GROUPS)
+    for skill in (*normalized_required, *normalized_preferred):
+        highlight_terms.update(get_skill_variations(skill))
+    return JDContext(
+        required_skills=normalized_required,
+        preferred_skills=normalized_preferred,
+        keywords=normalized_keywords,
+        keyword_variations={
+            k: get_skill_variations(k) for k in set(normalized_keywords)
+        },
+        highlight_skill_re=_skill_pattern(highlight_terms),
+    )
+
+
 class ATSAnalyzer:
     """Analyzes resume against job description for ATS compatibility."""
 
@@ -105,6 +290,7 @@ class ATSAnalyzer:
         self,
         resume_data: dict[str, Any],
         jd_data: dict[str, Any],
+        jd_context: JDContext | None = None,
     ) -> ATSScoreResult:
         """
         Calculate ATS compatibility score.
@@ -112,6 +298,8 @@ class ATSAnalyzer:
         Args:
             resume_data: Extracted resume data
             jd_data: Extracted job description data
+            jd_context: Precomputed JD requirements (built from jd_data
+                if not given)
 
         Returns:
             ATSScoreResult with scores and analysis
@@ -125,23 +313,20 @@ class ATSAnalyzer:
         for skill in resume_data.get("technical_skills", []):
             resume_skills.add(normalize_skill(skill))
 
-        # Also extract skills mentioned in experience highlights
-        for exp in resume_data.get("experience", []):
-            for highlight in exp.get("highlights", []):
-                # Simple extraction of capitalized words that might be skills
-                words = re.findall(r"\b[A-Z][a-zA-Z+#]+\b", highlight)
-                for word in words:
-                    if len(word) > 1:
-                        resume_skills.add(normalize_skill(word))
-
         # Get JD requirements
-        required_skills = [
-            normalize_skill(s) for s in jd_data.get("required_skills", [])
-        ]
-        preferred_skills = [
-            normalize_skill(s) for s in jd_data.get("preferred_skills", [])
-        ]
-        all_keywords = [normalize_skill(k) for k in jd_data.get("keywords", [])]
+        if jd_context is None:
+            jd_context = JDContext.from_jd_data(jd_data)
+
+        # Also add skills mentioned in experience highlights, collected in
+        # the same pass that builds the text for keyword searching
+        resume_text, highlight_words = self._get_resume_text(
+            resume_data, jd_context.highlight_skill_re
+        )
+        for word in highlight_words:
+            resume_skills.add(normalize_skill(word))
+        required_skills = jd_context.required_skills
+        preferred_skills = jd_context.preferred_skills
+        all_keywords = jd_context.keywords
 
         # Calculate skill matches
         skill_matches = []
@@ -152,25 +337,21 @@ class ATSAnalyzer:
         matched_keywords = []
         missing_keywords = []
 
+        # Expand each resume skill's synonyms once, not once per JD skill
+        variation_index = _build_variation_index(resume_skills)
+
         # Check required skills
         for req_skill in required_skills:
-            found = False
-            match_type = "none"
-            evidence = None
-
-            for resume_skill in resume_skills:
-                is_match, m_type = skills_match(req_skill, resume_skill)
-                if is_match:
-                    found = True
-                    match_type = m_type
-                    evidence = resume_skill
-                    break
+            match_type, evidence = self._find_skill_match(
+                req_skill, resume_skills, variation_index
+            )
+            found = evidence is not None
 
             skill_matches.append(
                 SkillMatch(
                     skill=req_skill,
                     found_in_resume=found,
-                    match_type=match_type if found else "none",
+                    match_type=match_type,
                     resume_evidence=evidence,
                 )
             )
@@ -182,23 +363,26 @@ class ATSAnalyzer:
 
         # Check preferred skills
         for pref_skill in preferred_skills:
-            found = False
-            for resume_skill in resume_skills:
-                is_match, _ = skills_match(pref_skill, resume_skill)
-                if is_match:
-                    found = True
-                    break
-
-            if found:
+            _, evidence = self._find_skill_match(
+                pref_skill, resume_skills, variation_index
+            )
+            if evidence is not None:
                 matched_preferred.append(pref_skill)
             else:
                 missing_preferred.append(pref_skill)
 
         # Check keywords
-        resume_text = self._get_resume_text(resume_data).lower()
+        # Keywords share synonyms, so scan the resume text once per term
+        found_in_text: dict[str, bool] = {}
+
+        def in_resume_text(term: str) -> bool:
+            if term not in found_in_text:
+                found_in_text[term] = term in resume_text
+            return found_in_text[term]
+
         for keyword in all_keywords:
-            if keyword in resume_text or any(
-                v in resume_text for v in get_skill_variations(keyword)
+            if in_resume_text(keyword) or any(
+                in_resume_text(v) for v in jd_context.keyword_variations[keyword]
             ):
                 matched_keywords.append(keyword)
             else:
@@ -260,7 +444,8 @@ class ATSAnalyzer:
 
         logger.success(f"ATS score: {ats_score}/100")
 
-        return ATSScoreResult(
+        # Every field is computed above, so skip re-validation
+        return ATSScoreResult.model_construct(
             ats_score=ats_score,
             keyword_match_score=keyword_match_score,
             skills_match_score=skills_match_score,
@@ -268,7 +453,8 @@ class ATSAnalyzer:
             education_match_score=education_match_score,
             matched_keywords=matched_keywords,
             missing_keywords=missing_keywords[:10],  # Top 10
-            matched_skills=matched_required + matched_preferred,
+            # A skill listed as both required and preferred is reported once
+            matched_skills=list(dict.fromkeys(matched_required + matched_preferred)),
             missing_required_skills=missing_required,
             missing_preferred_skills=missing_preferred,
             skill_matches=skill_matches,
@@ -276,9 +462,57 @@ class ATSAnalyzer:
             summary=summary,
         )
 
-    def _get_resume_text(self, resume_data: dict[str, Any]) -> str:
-        """Combine all resume text for keyword searching."""
+    @staticmethod
+    def _find_skill_match(
+        skill: str,
+        resume_skills: set[str],
+        variation_index: dict[str, str],
+    ) -> tuple[str, str | None]:
+        """
+        Find a resume skill matching a normalized JD skill.
+
+        Applies the same checks as skills_match, but exact and synonym
+        hits are dict lookups; only the partial and fuzzy checks scan the
+        resume skills pairwise.
+
+        Returns:
+            Tuple of (match_type, matching resume skill or None)
+        """
+        if skill in resume_skills:
+            return "exact", skill
+
+        for variation in get_skill_variations(skill):
+            resume_skill = variation_index.get(variation)
+            if resume_skill is not None:
+                return "synonym", resume_skill
+
+        for resume_skill in resume_skills:
+            if skill in resume_skill or resume_skill in skill:
+                return "partial", resume_skill
+            if fuzzy_match(skill, resume_skill):
+                return "fuzzy", resume_skill
+
+        return "none", None
+
+    @staticmethod
+    def _get_resume_text(
+        resume_data: dict[str, Any],
+        highlight_skill_re: re.Pattern[str],
+    ) -> tuple[str, list[str]]:
+        """
+        Combine all resume text for keyword searching.
+
+        Args:
+            resume_data: Extracted resume data
+            highlight_skill_re: Pattern of skill names to pick out of
+                experience highlights
+
+        Returns:
+            Tuple of (lowercased resume text, known skill names found in
+            experience highlights)
+        """
         parts = []
+        highlight_words = []
 
         # Add summary
         if resume_data.get("summary"):
@@ -292,7 +526,10 @@ class ATSAnalyzer:
         for exp in resume_data.get("experience") or []:
             parts.append(exp.get("role", ""))
             parts.append(exp.get("company", ""))
-            parts.extend(exp.get("highlights") or [])
+            highlights = exp.get("highlights") or []
+            parts.extend(highlights)
+            for highlight in highlights:
+                highlight_words.extend(highlight_skill_re.findall(highlight.lower()))
 
         # Add education
         for edu in resume_data.get("education") or []:
@@ -309,10 +546,11 @@ class ATSAnalyzer:
             parts.append(proj.get("description", ""))
             parts.extend(proj.get("technologies") or [])
 
-        return " ".join(str(p) for p in parts if p)
+        # join() materializes a generator into a list first; build it directly
+        return " ".join([str(p) for p in parts if p]).lower(), highlight_words
 
+    @staticmethod
     def _calculate_experience_score(
-        self,
         resume_data: dict[str, Any],
         jd_data: dict[str, Any],
     ) -> int:
@@ -347,8 +585,8 @@ class ATSAnalyzer:
             else:
                 return max(20, 50 - int(under * 10))
 
+    @staticmethod
     def _calculate_education_score(
-        self,
         resume_data: dict[str, Any],
         jd_data: dict[str, Any],
     ) -> int:
@@ -362,43 +600,10 @@ class ATSAnalyzer:
         if not resume_education:
             return 30  # No education listed
 
-        # Check highest degree
-        degrees = []
-        for edu in resume_education:
-            degree = edu.get("degree", "").lower()
-            degrees.append(degree)
-
-        # Simple matching
-        degree_levels = {
-            "phd": 5,
-            "doctorate": 5,
-            "ph.d": 5,
-            "master": 4,
-            "msc": 4,
-            "mba": 4,
-            "ms": 4,
-            "bachelor": 3,
-            "bsc": 3,
-            "ba": 3,
-            "bs": 3,
-            "associate": 2,
-            "diploma": 1,
-            "certificate": 1,
-        }
-
-        # Find required level
-        req_level = 0
-        for key, level in degree_levels.items():
-            if key in required_edu:
-                req_level = level
-                break
-
-        # Find candidate's highest level
-        candidate_level = 0
-        for degree in degrees:
-            for key, level in degree_levels.items():
-                if key in degree:
-                    candidate_level = max(candidate_level, level)
+        req_level = _degree_level(required_edu)
+        candidate_level = max(
+            _degree_level(edu.get("degree", "").lower()) for edu in resume_education
+        )
 
         if candidate_level >= req_level:
             return 100
@@ -407,8 +612,8 @@ class ATSAnalyzer:
         else:
             return 40
 
+    @staticmethod
     def _generate_suggestions(
-        self,
         missing_required: list[str],
         missing_preferred: list[str],
         missing_keywords: list[str],
@@ -419,6 +624,8 @@ class ATSAnalyzer:
     ) -> list[str]:
         """Generate improvement suggestions."""
         suggestions = []
+        missing_required_set = set(missing_required)
+        missing_preferred_set = set(missing_preferred)
 
         # Missing required skills
         if missing_required:
@@ -430,7 +637,7 @@ class ATSAnalyzer:
         # Missing preferred skills
         if missing_preferred and len(missing_preferred) > len(missing_required):
             top_missing = [
-                s for s in missing_preferred[:3] if s not in missing_required
+                s for s in missing_preferred[:3] if s not in missing_required_set
             ]
             if top_missing:
                 suggestions.append(
@@ -442,7 +649,7 @@ class ATSAnalyzer:
             unique_keywords = [
                 k
                 for k in missing_keywords[:5]
-                if k not in missing_required and k not in missing_preferred
+                if k not in missing_required_set and k not in missing_preferred_set
             ]
             if unique_keywords:
                 suggestions.append(
@@ -478,8 +685,8 @@ class ATSAnalyzer:
 
         return suggestions[:7]  # Max 7 suggestions
 
+    @staticmethod
     def _generate_summary(
-        self,
         ats_score: int,
         matched_required: int,
         total_required: int,
@@ -6,6 +6,7 @@ Provides fit scoring, red flag detection, career analysis, ranking, and comparis
 
 from app.services.candidate.analyzer import (
     CandidateAnalyzer,
+    detect_red_flags,
     format_education_for_prompt,
     format_experience_for_prompt,
     get_candidate_analyzer,
@@ -15,6 +16,7 @@ from app.services.candidate.ranker import CandidateRanker, get_candidate_ranker
 __all__ = [
     "CandidateAnalyzer",
     "get_candidate_analyzer",
+    "detect_red_flags",
     "format_experience_for_prompt",
     "format_education_for_prompt",
     "CandidateRanker",
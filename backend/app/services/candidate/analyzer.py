@@ -4,10 +4,12 @@ Candidate analysis service.
 Provides fit scoring, red flag detection, and career analysis.
 """
 
+import json
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
-from app.core import logger
+from app.core import get_logger
 from app.schemas.candidate import (
     CandidateFitResult,
     CareerProgression,
@@ -18,9 +20,11 @@ from app.schemas.candidate import (
     RedFlagType,
     StrengthItem,
 )
-from app.services.llm import get_llm_client
+from app.services.llm import get_fit_cache, get_llm_client
 from app.services.llm.parser import parse_llm_response
 
+logger = get_logger()
+
 # Prompt for fit scoring and red flag detection
 FIT_ANALYSIS_SYSTEM_PROMPT = """You are an expert HR analyst and recruiter with 20+ years of experience screening candidates. You analyze resumes against job descriptions to provide actionable insights.
 
@@ -212,6 +216,137 @@ def format_jd_for_prompt(jd_data: dict) -> str:
     return "\n".join(parts) if parts else "No specific requirements provided"
 
 
+def _clamp_score(value: Any, default: int) -> int:
+    """Coerce an LLM-provided score to an int in [0, 100]."""
+    try:
+        score = int(float(value))
+    except (TypeError, ValueError, OverflowError):
+        return default
+    return max(0, min(100, score))
+
+
+def _as_str_list(value: Any) -> list[str]:
+    """Coerce an LLM-provided list to a list of non-empty strings."""
+    if not isinstance(value, list):
+        return []
+    return [str(item) for item in value if item]
+
+
+def _detect_short_tenure(experience: list[dict]) -> RedFlag | None:
+    """Flag two or more non-intern jobs that lasted under a year."""
+    short_tenure_count = 0
+    for exp in experience:
+        months = exp.get("duration_months", 0) or 0
+        is_current = exp.get("is_current", False)
+
+        # Skip if current job or internship
+        role = (exp.get("role") or "").lower()
+        if is_current or "intern" in role:
+            continue
+
+        if 0 < months < 12:
+            short_tenure_count += 1
+
+    if short_tenure_count < 2:
+        return None
+
+    return RedFlag(
+        flag_type=RedFlagType.SHORT_TENURE,
+        severity=(
+            RedFlagSeverity.MEDIUM if short_tenure_count == 2 else RedFlagSeverity.HIGH
+        ),
+        title=f"{short_tenure_count} jobs with tenure < 1 year",
+        description=f"Candidate has {short_tenure_count} positions with less than 12 months tenure",
+        evidence=None,
+        suggestion="Ask about reasons for leaving each short-tenure position",
+    )
+
+
+def _detect_frequent_job_changes(experience: list[dict]) -> RedFlag | None:
+    """Flag four or more past jobs averaging under 18 months each."""
+    non_current_jobs = [e for e in experience if not e.get("is_current", False)]
+    if len(non_current_jobs) < 4:
+        return None
+
+    # Calculate average tenure
+    total_months = sum(e.get("duration_months", 0) or 0 for e in non_current_jobs)
+    avg_months = total_months / len(non_current_jobs)
+    if avg_months >= 18:
+        return None
+
+    return RedFlag(
+        flag_type=RedFlagType.FREQUENT_JOB_CHANGES,
+        severity=RedFlagSeverity.MEDIUM,
+        title="Frequent job changes pattern",
+        description=f"Average tenure of {avg_months:.0f} months across {len(non_current_jobs)} positions",
+        evidence=None,
+        suggestion="Discuss career goals and what they're looking for in next role",
+    )
+
+
+def _detect_employment_gap(experience: list[dict]) -> RedFlag | None:
+    """Flag a most recent position that ended before 2024."""
+    most_recent = experience[0]
+    if most_recent.get("is_current", False):
+        return None
+
+    end_date = most_recent.get("end_date", "")
+    if not end_date or end_date == "Present" or not isinstance(end_date, str):
+        return None
+
+    # Simple check - if end_date is older than 6 months
+    if "2024" in end_date or "2025" in end_date or "2026" in end_date:
+        return None
+
+    return RedFlag(
+        flag_type=RedFlagType.EMPLOYMENT_GAP,
+        severity=RedFlagSeverity.MEDIUM,
+        title="Possible employment gap",
+        description="Most recent position may have ended some time ago",
+        evidence=f"Last position ended: {end_date}",
+        suggestion="Ask about activities since last position",
+    )
+
+
+# Rule-based detectors, run in this order
+RED_FLAG_DETECTORS: dict[RedFlagType, Callable[[list[dict]], RedFlag | None]] = {
+    RedFlagType.SHORT_TENURE: _detect_short_tenure,
+    RedFlagType.FREQUENT_JOB_CHANGES: _detect_frequent_job_changes,
+    RedFlagType.EMPLOYMENT_GAP: _detect_employment_gap,
+}
+
+
+def detect_red_flags(
+    resume_data: dict[str, Any],
+    enabled: set[RedFlagType] | None = None,
+) -> list[RedFlag]:
+    """
+    Detect red flags using rule-based logic.
+
+    Pure function of the resume data, so it can run on any worker
+    without touching analyzer state.
+
+    Args:
+        resume_data: Extracted resume data
+        enabled: Flag types to check (all detectors if None)
+
+    Returns:
+        Detected red flags
+    """
+    experience = resume_data.get("experience") or []
+    if not experience:
+        return []
+
+    flags = []
+    for flag_type, detector in RED_FLAG_DETECTORS.items():
+        if enabled is not None and flag_type not in enabled:
+            continue
+        flag = detector(experience)
+        if flag is not None:
+            flags.append(flag)
+    return flags
+
+
 @dataclass
 class CandidateAnalyzer:
     """Analyzes candidates for fit scoring and red flag detection."""
@@ -234,7 +369,7 @@ class CandidateAnalyzer:
         logger.processing("candidate fit analysis")
 
         # First, do rule-based red flag detection
-        rule_based_flags = self._detect_red_flags_rules(resume_data)
+        rule_based_flags = detect_red_flags(resume_data)
 
         # Then, use LLM for comprehensive analysis
         llm_result = self._analyze_with_llm(resume_data, jd_data)
@@ -261,99 +396,22 @@ class CandidateAnalyzer:
         # Fallback to rule-based only
         return self._create_fallback_result(resume_data, jd_data, rule_based_flags)
 
-    def _detect_red_flags_rules(self, resume_data: dict[str, Any]) -> list[RedFlag]:
-        """Detect red flags using rule-based logic."""
-        flags = []
-        experience = resume_data.get("experience") or []
-
-        if not experience:
-            return flags
-
-        # Check for short tenures
-        short_tenure_count = 0
-        for exp in experience:
-            months = exp.get("duration_months", 0) or 0
-            is_current = exp.get("is_current", False)
-
-            # Skip if current job or internship
-            role = (exp.get("role") or "").lower()
-            if is_current or "intern" in role:
-                continue
-
-            if 0 < months < 12:
-                short_tenure_count += 1
-
-        if short_tenure_count >= 2:
-            flags.append(
-                RedFlag(
-                    flag_type=RedFlagType.SHORT_TENURE,
-                    severity=(
-                        RedFlagSeverity.MEDIUM
-                        if short_tenure_count == 2
-                        else RedFlagSeverity.HIGH
-                    ),
-                    title=f"{short_tenure_count} jobs with tenure < 1 year",
-                    description=f"Candidate has {short_tenure_count} positions with less than 12 months tenure",
-                    evidence=None,
-                    suggestion="Ask about reasons for leaving each short-tenure position",
-                )
-            )
-
-        # Check for frequent job changes
-        non_current_jobs = [e for e in experience if not e.get("is_current", False)]
-        if len(non_current_jobs) >= 4:
-            # Calculate average tenure
-            total_months = sum(
-                e.get("duration_months", 0) or 0 for e in non_current_jobs
-            )
-            avg_months = total_months / len(non_current_jobs) if non_current_jobs else 0
-
-            if avg_months < 18:
-                flags.append(
-                    RedFlag(
-                        flag_type=RedFlagType.FREQUENT_JOB_CHANGES,
-                        severity=RedFlagSeverity.MEDIUM,
-                        title="Frequent job changes pattern",
-                        description=f"Average tenure of {avg_months:.0f} months across {len(non_current_jobs)} positions",
-                        evidence=None,
-                        suggestion="Discuss career goals and what they're looking for in next role",
-                    )
-                )
-
-        # Check for no recent experience
-        if experience:
-            most_recent = experience[0]
-            if not most_recent.get("is_current", False):
-                end_date = most_recent.get("end_date", "")
-                if end_date and end_date != "Present":
-                    # Simple check - if end_date is older than 6 months
-                    try:
-                        if (
-                            "2024" not in end_date
-                            and "2025" not in end_date
-                            and "2026" not in end_date
-                        ):
-                            flags.append(
-                                RedFlag(
-                                    flag_type=RedFlagType.EMPLOYMENT_GAP,
-                                    severity=RedFlagSeverity.MEDIUM,
-                                    title="Possible employment gap",
-                                    description="Most recent position may have ended some time ago",
-                                    evidence=f"Last position ended: {end_date}",
-                                    suggestion="Ask about activities since last position",
-                                )
-                            )
-                    except Exception:
-                        pass
-
-        return flags
-
     def _analyze_with_llm(
         self,
         resume_data: dict[str, Any],
         jd_data: dict[str, Any],
     ) -> CandidateFitResult | None:
         """Use LLM for comprehensive candidate analysis."""
+        # Identical resume/JD pairs reuse the previous LLM analysis
+        fit_cache = get_fit_cache()
+        cache_text = json.dumps(
+            {"resume": resume_data, "jd": jd_data}, sort_keys=True, default=str
+        )
+        cached: CandidateFitResult | None = fit_cache.get(cache_text)
+        if cached is not None:
+            logger.info("Fit analysis served from cache")
+            return cached
+
         try:
             llm = get_llm_client()
 
@@ -392,7 +450,9 @@ class CandidateAnalyzer:
             data = parse_result.data
 
             # Build result
-            return self._build_result_from_llm(data)
+            result = self._build_result_from_llm(data)
+            fit_cache.put(cache_text, result)
+            return result
 
         except Exception as e:
             logger.error(f"LLM analysis failed: {e}")
@@ -402,7 +462,7 @@ class CandidateAnalyzer:
         """Build CandidateFitResult from LLM response."""
         # Parse red flags
         red_flags = []
-        for rf in data.get("red_flags", []):
+        for rf in data.get("red_flags") or []:
             try:
                 flag_type = rf.get("flag_type", "OTHER").upper()
                 if flag_type not in [e.value.upper() for e in RedFlagType]:
@@ -427,14 +487,14 @@ class CandidateAnalyzer:
 
         # Parse strengths
         strengths = []
-        for s in data.get("strengths", []):
+        for s in data.get("strengths") or []:
             try:
                 strengths.append(
                     StrengthItem(
                         category=s.get("category", "general"),
                         title=s.get("title", ""),
                         description=s.get("description", ""),
-                        relevance_score=s.get("relevance_score", 80),
+                        relevance_score=_clamp_score(s.get("relevance_score"), 80),
                     )
                 )
             except Exception:
@@ -458,23 +518,20 @@ class CandidateAnalyzer:
             except Exception:
                 pass
 
-        # Parse score breakdown
+        # Parse score breakdown (clamped, so it can skip validation)
         breakdown = None
         bd_data = data.get("fit_score_breakdown")
-        if bd_data:
-            try:
-                breakdown = FitScoreBreakdown(
-                    skills_alignment=bd_data.get("skills_alignment", 70),
-                    experience_match=bd_data.get("experience_match", 70),
-                    education_fit=bd_data.get("education_fit", 70),
-                    career_trajectory=bd_data.get("career_trajectory", 70),
-                    cultural_signals=bd_data.get("cultural_signals", 70),
-                )
-            except Exception:
-                pass
+        if isinstance(bd_data, dict):
+            breakdown = FitScoreBreakdown.model_construct(
+                skills_alignment=_clamp_score(bd_data.get("skills_alignment"), 70),
+                experience_match=_clamp_score(bd_data.get("experience_match"), 70),
+                education_fit=_clamp_score(bd_data.get("education_fit"), 70),
+                career_trajectory=_clamp_score(bd_data.get("career_trajectory"), 70),
+                cultural_signals=_clamp_score(bd_data.get("cultural_signals"), 70),
+            )
 
         # Parse recommendation
-        rec_str = data.get("recommendation", "NEEDS_REVIEW").upper()
+        rec_str = str(data.get("recommendation") or "NEEDS_REVIEW").upper()
         rec_map = {
             "STRONG_HIRE": RecommendationType.STRONG_HIRE,
             "GOOD_FIT": RecommendationType.GOOD_FIT,
@@ -484,22 +541,25 @@ class CandidateAnalyzer:
         }
         recommendation = rec_map.get(rec_str, RecommendationType.NEEDS_REVIEW)
 
-        return CandidateFitResult(
-            fit_score=data.get("fit_score", 50),
+        # Every field is coerced above, so an out-of-range score or a
+        # null list no longer throws away the whole LLM analysis
+        suggested_level = data.get("suggested_level")
+        return CandidateFitResult.model_construct(
+            fit_score=_clamp_score(data.get("fit_score"), 50),
             fit_score_breakdown=breakdown,
             recommendation=recommendation,
-            recommendation_text=data.get("recommendation_text", ""),
+            recommendation_text=str(data.get("recommendation_text") or ""),
             strengths=strengths,
-            weaknesses=data.get("weaknesses", []),
+            weaknesses=_as_str_list(data.get("weaknesses")),
             red_flags=red_flags,
             red_flag_count=len(red_flags),
             has_critical_red_flags=any(
                 f.severity == RedFlagSeverity.HIGH for f in red_flags
             ),
             career_progression=career_prog,
-            executive_summary=data.get("executive_summary", ""),
-            interview_questions=data.get("interview_questions", []),
-            suggested_level=data.get("suggested_level"),
+            executive_summary=str(data.get("executive_summary") or ""),
+            interview_questions=_as_str_list(data.get("interview_questions")),
+            suggested_level=str(suggested_level) if suggested_level else None,
             analysis_confidence=0.85,
         )
 
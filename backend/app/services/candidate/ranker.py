@@ -4,7 +4,9 @@ Candidate ranking and comparison service.
 Provides multi-resume ranking, comparison, and side-by-side analysis.
 """
 
-from app.core import logger
+from dataclasses import dataclass
+
+from app.core import get_logger
 from app.schemas.candidate import (
     CandidateComparison,
     CandidateRankingScore,
@@ -13,6 +15,61 @@ from app.schemas.candidate import (
     RecommendationType,
 )
 
+logger = get_logger()
+
+
+@dataclass(slots=True, frozen=True)
+class _FitStats:
+    """Fit analysis fields used for ranking, with defaults when it is missing."""
+
+    fit_score: int = 0
+    recommendation: RecommendationType = RecommendationType.NEEDS_REVIEW
+    strengths_count: int = 0
+    red_flags_count: int = 0
+    has_critical_red_flags: bool = False
+    suggested_level: str | None = None
+    executive_summary: str | None = None
+
+    @classmethod
+    def from_analysis(cls, analysis: FullCandidateAnalysis) -> "_FitStats":
+        """Collect the fit statistics of one candidate analysis."""
+        fit = analysis.fit_analysis
+        if fit is None:
+            return cls()
+        return cls(
+            fit_score=fit.fit_score,
+            recommendation=fit.recommendation,
+            strengths_count=len(fit.strengths),
+            red_flags_count=fit.red_flag_count,
+            has_critical_red_flags=fit.has_critical_red_flags,
+            suggested_level=fit.suggested_level,
+            executive_summary=fit.executive_summary,
+        )
+
+
+def skill_overlap(
+    skill_lists: list[list[str]],
+) -> tuple[list[str], list[list[str]]]:
+    """
+    Split the matched skills of N candidates into common and unique sets.
+
+    Args:
+        skill_lists: Matched skills for each candidate
+
+    Returns:
+        Tuple of (skills every candidate has, skills only each candidate has)
+    """
+    skill_sets = [set(skills) for skills in skill_lists]
+    if not skill_sets:
+        return [], []
+
+    common = set.intersection(*skill_sets)
+    unique = []
+    for idx, skills in enumerate(skill_sets):
+        others = set().union(*(o for i, o in enumerate(skill_sets) if i != idx))
+        unique.append(list(skills - others))
+    return list(common), unique
+
 
 class CandidateRanker:
     """Ranks and compares multiple candidates for a job."""
@@ -45,41 +102,20 @@ class CandidateRanker:
         ranking_scores: list[CandidateRankingScore] = []
 
         for file_name, analysis in analyses.items():
+            stats = _FitStats.from_analysis(analysis)
             score = CandidateRankingScore(
                 rank=0,  # Will be set after sorting
                 file_name=file_name,
                 candidate_name=analysis.candidate_name,
                 overall_score=analysis.overall_score,
                 ats_score=analysis.ats_score,
-                fit_score=(
-                    analysis.fit_analysis.fit_score if analysis.fit_analysis else 0
-                ),
-                recommendation=(
-                    analysis.fit_analysis.recommendation
-                    if analysis.fit_analysis
-                    else RecommendationType.NEEDS_REVIEW
-                ),
-                strengths_count=(
-                    len(analysis.fit_analysis.strengths) if analysis.fit_analysis else 0
-                ),
-                red_flags_count=(
-                    analysis.fit_analysis.red_flag_count if analysis.fit_analysis else 0
-                ),
-                has_critical_red_flags=(
-                    analysis.fit_analysis.has_critical_red_flags
-                    if analysis.fit_analysis
-                    else False
-                ),
-                suggested_level=(
-                    analysis.fit_analysis.suggested_level
-                    if analysis.fit_analysis
-                    else None
-                ),
-                executive_summary=(
-                    analysis.fit_analysis.executive_summary
-                    if analysis.fit_analysis
-                    else None
-                ),
+                fit_score=stats.fit_score,
+                recommendation=stats.recommendation,
+                strengths_count=stats.strengths_count,
+                red_flags_count=stats.red_flags_count,
+                has_critical_red_flags=stats.has_critical_red_flags,
+                suggested_level=stats.suggested_level,
+                executive_summary=stats.executive_summary,
             )
             ranking_scores.append(score)
 
@@ -94,15 +130,17 @@ class CandidateRanker:
         total_score = sum(s.overall_score for s in ranking_scores)
         average_score = total_score / len(ranking_scores) if ranking_scores else 0
 
-        # Score distribution
-        score_dist = {
-            "excellent": len([s for s in ranking_scores if s.overall_score >= 85]),
-            "good": len([s for s in ranking_scores if 70 <= s.overall_score < 85]),
-            "acceptable": len(
-                [s for s in ranking_scores if 50 <= s.overall_score < 70]
-            ),
-            "poor": len([s for s in ranking_scores if s.overall_score < 50]),
-        }
+        # Score distribution (single pass)
+        score_dist = {"excellent": 0, "good": 0, "acceptable": 0, "poor": 0}
+        for s in ranking_scores:
+            if s.overall_score >= 85:
+                score_dist["excellent"] += 1
+            elif s.overall_score >= 70:
+                score_dist["good"] += 1
+            elif s.overall_score >= 50:
+                score_dist["acceptable"] += 1
+            else:
+                score_dist["poor"] += 1
 
         # Get top candidate
         top_candidate = ranking_scores[0] if ranking_scores else None
@@ -186,11 +224,11 @@ class CandidateRanker:
         logger.processing("candidate comparison")
 
         # Calculate skill differences
-        skills_1 = set(analysis_1.matched_skills)
-        skills_2 = set(analysis_2.matched_skills)
-        unique_1 = list(skills_1 - skills_2)
-        unique_2 = list(skills_2 - skills_1)
-        common = list(skills_1 & skills_2)
+        common, (unique_1, unique_2) = skill_overlap(
+            [analysis_1.matched_skills, analysis_2.matched_skills]
+        )
+        stats_1 = _FitStats.from_analysis(analysis_1)
+        stats_2 = _FitStats.from_analysis(analysis_2)
 
         # Determine winner
         score_diff = analysis_1.overall_score - analysis_2.overall_score
@@ -207,43 +245,19 @@ class CandidateRanker:
             overall_score_diff=score_diff,
             ats_score_1=analysis_1.ats_score,
             ats_score_2=analysis_2.ats_score,
-            fit_score_1=(
-                analysis_1.fit_analysis.fit_score if analysis_1.fit_analysis else 0
-            ),
-            fit_score_2=(
-                analysis_2.fit_analysis.fit_score if analysis_2.fit_analysis else 0
-            ),
+            fit_score_1=stats_1.fit_score,
+            fit_score_2=stats_2.fit_score,
             matched_skills_1=analysis_1.matched_skills,
             matched_skills_2=analysis_2.matched_skills,
             unique_skills_1=unique_1,
             unique_skills_2=unique_2,
             common_skills=common,
-            red_flags_1=(
-                analysis_1.fit_analysis.red_flag_count if analysis_1.fit_analysis else 0
-            ),
-            red_flags_2=(
-                analysis_2.fit_analysis.red_flag_count if analysis_2.fit_analysis else 0
-            ),
-            critical_flags_1=(
-                analysis_1.fit_analysis.has_critical_red_flags
-                if analysis_1.fit_analysis
-                else False
-            ),
-            critical_flags_2=(
-                analysis_2.fit_analysis.has_critical_red_flags
-                if analysis_2.fit_analysis
-                else False
-            ),
-            recommendation_1=(
-                analysis_1.fit_analysis.recommendation
-                if analysis_1.fit_analysis
-                else RecommendationType.NEEDS_REVIEW
-            ),
-            recommendation_2=(
-                analysis_2.fit_analysis.recommendation
-                if analysis_2.fit_analysis
-                else RecommendationType.NEEDS_REVIEW
-            ),
+            red_flags_1=stats_1.red_flags_count,
+            red_flags_2=stats_2.red_flags_count,
+            critical_flags_1=stats_1.has_critical_red_flags,
+            critical_flags_2=stats_2.has_critical_red_flags,
+            recommendation_1=stats_1.recommendation,
+            recommendation_2=stats_2.recommendation,
             winner=winner,
             winner_reason=winner_reason,
         )
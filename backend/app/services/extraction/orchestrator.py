@@ -10,7 +10,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-from app.core import ExtractionError, PDFExtractorError, logger
+from app.core import ExtractionError, PDFExtractorError, get_logger
 from app.core.config import get_settings
 from app.services.extraction.post_processor import post_process_invoice
 from app.services.llm import LLMClient, get_llm_client
@@ -29,6 +29,8 @@ from app.services.pdf import (
     process_text,
 )
 
+logger = get_logger()
+
 
 @dataclass
 class ExtractionMetadata:
@@ -10,7 +10,9 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
-from app.core import logger
+from app.core import get_logger
+
+logger = get_logger()
 
 
 @dataclass
@@ -24,6 +24,11 @@ from app.schemas.invoice import InvoiceData, LineItem
 
 logger = logging.getLogger(__name__)
 
+# Two-cent rounding tolerance for line item and totals checks
+_AMOUNT_TOLERANCE = Decimal("0.02")
+# Amounts above this are flagged as possibly misplaced decimals
+_LARGE_AMOUNT = Decimal("10000000")
+
 
 @dataclass
 class ValidationConfig:
@@ -386,7 +391,7 @@ class ExtractionValidator:
             )
 
         # Check for unreasonably large amounts
-        elif amount > Decimal("10000000"):
+        elif amount > _LARGE_AMOUNT:
             confidence = FieldConfidence.MEDIUM
             score = 0.6
             issue = ValidationResult(
@@ -444,8 +449,7 @@ class ExtractionValidator:
                 and item.amount is not None
             ):
                 expected = Decimal(str(item.quantity)) * item.unit_price
-                tolerance = Decimal("0.02")  # Allow 2 cents tolerance
-                if abs(item.amount - expected) > tolerance:
+                if abs(item.amount - expected) > _AMOUNT_TOLERANCE:
                     issues.append(
                         ValidationResult(
                             field_name=f"line_item_{i}_calculation",
@@ -488,13 +492,11 @@ class ExtractionValidator:
     ) -> list[ValidationResult]:
         """Validate that invoice totals are mathematically consistent."""
         issues: list[ValidationResult] = []
-        tolerance = Decimal("0.02")
+        tolerance = _AMOUNT_TOLERANCE
 
         # Check line items sum to subtotal
         if invoice.line_items and invoice.subtotal is not None:
-            items_total = sum(
-                item.amount for item in invoice.line_items if item.amount is not None
-            )
+            items_total = invoice.get_line_items_total()
             if items_total > 0 and abs(invoice.subtotal - items_total) > tolerance:
                 hint = f"Items sum: {items_total}, Subtotal: {invoice.subtotal}"
                 issues.append(
@@ -5,6 +5,12 @@ Provides LLM client abstraction for both local (Ollama)
 and cloud (Groq) inference, plus prompt engineering and response parsing.
 """
 
+from app.services.llm.cache import (
+    ContentCache,
+    content_hash,
+    get_fit_cache,
+    get_jd_cache,
+)
 from app.services.llm.client import LLMClient, LLMMode, LLMResponse, get_llm_client
 from app.services.llm.ollama_client import OllamaClient, OllamaResponse
 from app.services.llm.parser import (
@@ -25,6 +31,11 @@ __all__ = [
     "LLMMode",
     "LLMResponse",
     "get_llm_client",
+    # Result caching
+    "ContentCache",
+    "content_hash",
+    "get_jd_cache",
+    "get_fit_cache",
     # Ollama direct
     "OllamaClient",
     "OllamaResponse",
@@ -0,0 +1,138 @@
+"""
+Content-addressed cache for LLM results.
+
+Results of expensive LLM calls are keyed by the model name and a hash
+of the input text, so identical inputs (e.g. the same job description
+submitted for several resumes) are only sent to the LLM once.
+"""
+
+import hashlib
+import pickle
+import threading
+from collections import OrderedDict
+from typing import Any
+
+from app.core.config import get_settings
+
+
+def content_hash(text: str) -> str:
+    """Return a short, stable hash of the given text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+def current_model_name() -> str:
+    """Return the name of the model configured for the active LLM mode."""
+    settings = get_settings()
+    if settings.llm_mode == "local":
+        return settings.ollama_model
+    return settings.groq_model
+
+
+class ContentCache:
+    """
+    Thread-safe LRU cache keyed by ``"{model}:{sha256(text)[:16]}"``.
+
+    Values are stored pickled: a flat bytes blob is far smaller than the
+    live dict/model graph, and every get() unpickles a fresh copy, so
+    callers can freely mutate what they get back.
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries before evicting the
+                least recently used one
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(text: str, model: str | None = None) -> str:
+        """Build the cache key for a text and model."""
+        return f"{model or current_model_name()}:{content_hash(text)}"
+
+    def get(self, text: str, model: str | None = None) -> Any | None:
+        """
+        Look up a cached value.
+
+        Args:
+            text: Input text the value was computed from
+            model: Model name (defaults to the configured model)
+
+        Returns:
+            Copy of the cached value, or None on a miss
+        """
+        key = self.make_key(text, model)
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            blob = self._entries[key]
+        return pickle.loads(blob)
+
+    def put(self, text: str, value: Any, model: str | None = None) -> None:
+        """
+        Store a value for the given text.
+
+        Args:
+            text: Input text the value was computed from
+            value: Value to cache
+            model: Model name (defaults to the configured model)
+        """
+        key = self.make_key(text, model)
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._entries[key] = blob
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, text: str) -> int:
+        """
+        Drop every cached value computed from the given text, for any model.
+
+        Args:
+            text: Input text whose entries should be removed
+
+        Returns:
+            Number of entries removed
+        """
+        suffix = f":{content_hash(text)}"
+        with self._lock:
+            stale = [key for key in self._entries if key.endswith(suffix)]
+            for key in stale:
+                del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
+
+
+# Singleton instances for job description extraction and fit analysis results
+_jd_cache: ContentCache | None = None
+_fit_cache: ContentCache | None = None
+
+
+def get_jd_cache() -> ContentCache:
+    """Get the singleton cache for extracted job description data."""
+    global _jd_cache
+    if _jd_cache is None:
+        _jd_cache = ContentCache()
+    return _jd_cache
+
+
+def get_fit_cache() -> ContentCache:
+    """Get the singleton cache for candidate fit analysis results."""
+    global _fit_cache
+    if _fit_cache is None:
+        _fit_cache = ContentCache()
+    return _fit_cache
@@ -17,10 +17,12 @@ from app.core import (
     LLMError,
     LLMResponseError,
     LLMTimeoutError,
-    logger,
+    get_logger,
 )
 from app.core.config import get_settings
 
+logger = get_logger()
+
 
 class LLMMode(str, Enum):
     """LLM inference mode."""
@@ -11,9 +11,11 @@ from typing import Any
 
 import httpx
 
-from app.core import LLMConnectionError, LLMResponseError, LLMTimeoutError, logger
+from app.core import LLMConnectionError, LLMResponseError, LLMTimeoutError, get_logger
 from app.core.config import get_settings
 
+logger = get_logger()
+
 
 @dataclass
 class OllamaResponse:
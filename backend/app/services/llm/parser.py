@@ -10,7 +10,9 @@ import re
 from dataclasses import dataclass, field
 from typing import Any
 
-from app.core import ExtractionParseError, logger
+from app.core import ExtractionParseError, get_logger, make_parse_error
+
+logger = get_logger()
 
 
 @dataclass
@@ -146,7 +148,7 @@ def parse_llm_response(
     logger.warning(f"{error}: {raw[:200]}...")
 
     if strict:
-        raise ExtractionParseError(error, raw[:500])
+        raise make_parse_error(raw, error)
 
     return ParseResult(
         success=False,
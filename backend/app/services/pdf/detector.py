@@ -10,7 +10,9 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
-from app.core import logger
+from app.core import get_logger
+
+logger = get_logger()
 
 
 class DocumentType(str, Enum):
@@ -11,7 +11,9 @@ from typing import Any
 
 import pdfplumber
 
-from app.core import EmptyPDFError, PDFExtractionError, ScannedPDFError, logger
+from app.core import EmptyPDFError, PDFExtractionError, ScannedPDFError, get_logger
+
+logger = get_logger()
 
 
 @dataclass
@@ -9,7 +9,9 @@ import re
 from dataclasses import dataclass, field
 from typing import Any
 
-from app.core import logger
+from app.core import get_logger
+
+logger = get_logger()
 
 
 @dataclass
@@ -0,0 +1,72 @@
+"""Tests for the ATS scoring service."""
+
+import pytest
+
+from app.services.ats import get_ats_analyzer, skills_match
+
+
+def _score(resume_data: dict, jd_data: dict):
+    return get_ats_analyzer().calculate_ats_score(resume_data, jd_data)
+
+
+def test_highlight_only_skill_outside_synonym_table_matches():
+    resume = {
+        "skills": ["Python"],
+        "experience": [
+            {
+                "role": "Engineer",
+                "company": "Acme",
+                "highlights": ["Built streaming pipelines on Kafka and Spark"],
+            }
+        ],
+    }
+    jd = {"required_skills": ["Python", "Kafka", "Spark"]}
+
+    result = _score(resume, jd)
+
+    assert result.missing_required_skills == []
+    matches = {m.skill: m for m in result.skill_matches}
+    assert matches["kafka"].match_type == "exact"
+    assert matches["spark"].match_type == "exact"
+
+
+def test_highlight_noise_words_do_not_match_skills():
+    resume = {
+        "experience": [
+            {
+                "role": "Engineer",
+                "company": "Acme",
+                "highlights": ["Led migrations In production At scale"],
+            }
+        ],
+    }
+    jd = {"required_skills": ["Linux", "Data Analysis"]}
+
+    result = _score(resume, jd)
+
+    assert result.missing_required_skills == ["linux", "data analysis"]
+
+
+@pytest.mark.parametrize(
+    ("skill1", "skill2"),
+    [
+        ("rust", "rest"),
+        ("jest", "rest"),
+        ("node", "code"),
+        ("swift", "shift"),
+        ("react", "reach"),
+        ("scala", "scale"),
+    ],
+)
+def test_similar_short_skill_names_do_not_match(skill1, skill2):
+    assert skills_match(skill1, skill2) == (False, "none")
+
+
+def test_typo_in_long_skill_name_is_a_fuzzy_match():
+    assert skills_match("tensorflw", "tensorflow") == (True, "fuzzy")
+
+
+def test_rest_does_not_satisfy_required_rust():
+    result = _score({"skills": ["REST"]}, {"required_skills": ["Rust"]})
+
+    assert result.missing_required_skills == ["rust"]
@@ -0,0 +1,66 @@
+"""Tests for the batch extraction endpoint."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core import get_settings
+from app.main import app
+from app.services.extraction import ExtractionOrchestrator
+from app.services.extraction.orchestrator import ExtractionResult
+
+BATCH_URL = f"{get_settings().api_prefix}/extract/batch"
+
+
+@pytest.fixture
+def client():
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def fake_extraction(monkeypatch):
+    def extract_from_pdf(self, file_path, force_type=None):
+        if "broken" in file_path.name:
+            return ExtractionResult(
+                success=False,
+                document_type="unknown",
+                error={"code": "TextExtractionError", "message": "No text"},
+            )
+        return ExtractionResult(
+            success=True,
+            document_type="resume",
+            extracted_fields={"candidate_name": "Jane Doe"},
+        )
+
+    monkeypatch.setattr(ExtractionOrchestrator, "extract_from_pdf", extract_from_pdf)
+
+
+def _pdf(name: str) -> tuple[str, tuple[str, bytes, str]]:
+    return ("files", (name, b"%PDF-1.4 test", "application/pdf"))
+
+
+def test_batch_response_includes_progress_and_success_rate(client, fake_extraction):
+    response = client.post(
+        BATCH_URL, files=[_pdf("one.pdf"), _pdf("two.pdf"), _pdf("broken.pdf")]
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total_files"] == 3
+    assert body["processed"] == 3
+    assert body["successful"] == 2
+    assert body["failed"] == 1
+    assert body["status"] == "partial"
+    assert body["progress_percentage"] == 100.0
+    assert body["success_rate"] == pytest.approx(2 / 3)
+    assert body["total_time"] >= 0
+    assert body["started_at"] and body["completed_at"]
+    assert len(body["results"]) == 3
+    assert body["results"][2]["error"]["message"] == "No text"
+
+
+def test_batch_openapi_uses_schema_model(client):
+    schema = app.openapi()["components"]["schemas"]["BatchExtractionResponse"]
+
+    assert "progress_percentage" in schema["properties"]
+    assert "success_rate" in schema["properties"]
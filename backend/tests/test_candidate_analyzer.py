@@ -0,0 +1,26 @@
+"""Tests for the candidate fit analyzer."""
+
+import pytest
+
+from app.services.candidate.analyzer import _clamp_score
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (85, 85),
+        ("72", 72),
+        (64.9, 64),
+        (150, 100),
+        (-5, 0),
+        (None, 50),
+        ("n/a", 50),
+        ("nan", 50),
+        ("inf", 50),
+        ("-inf", 50),
+        ("1e999", 50),
+        (float("inf"), 50),
+    ],
+)
+def test_clamp_score(value, expected):
+    assert _clamp_score(value, default=50) == expected
@@ -0,0 +1,62 @@
+"""Tests for settings overrides."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core import Settings, reset_settings, set_settings
+from app.main import app, create_app
+
+
+@pytest.fixture
+def override_settings():
+    def override(**values):
+        settings = Settings(**values)
+        set_settings(settings)
+        return settings
+
+    yield override
+    reset_settings()
+
+
+def test_endpoints_see_overridden_settings(override_settings):
+    settings = override_settings(max_upload_size_mb=3, llm_timeout=42)
+
+    response = TestClient(app).get(f"{settings.api_prefix}/health/info")
+
+    assert response.status_code == 200
+    assert response.json()["limits"]["max_upload_size_mb"] == 3
+    assert response.json()["limits"]["timeout_seconds"] == 42
+
+
+def test_upload_limit_follows_overridden_settings(override_settings):
+    settings = override_settings(max_upload_size_mb=0)
+
+    response = TestClient(app).post(
+        f"{settings.api_prefix}/extract/",
+        files={"file": ("invoice.pdf", b"%PDF-1.4 test", "application/pdf")},
+    )
+
+    assert response.status_code == 413
+
+
+def test_create_app_applies_overridden_app_settings(override_settings):
+    override_settings(debug=True, api_prefix="/api/v2", app_name="Test Extractor")
+
+    client = TestClient(create_app())
+
+    assert client.get("/docs").status_code == 200
+    assert client.get("/api/v2/health").status_code == 200
+    assert client.get("/").json()["name"] == "Test Extractor"
+
+
+def test_lifespan_sizes_analysis_semaphore_from_settings(override_settings):
+    override_settings(max_concurrent_analyses=3)
+    app_ = create_app()
+
+    with TestClient(app_):
+        first = app_.state.analysis_semaphore
+        assert first._value == 3
+
+    # A restarted app gets a fresh semaphore for its new event loop
+    with TestClient(app_):
+        assert app_.state.analysis_semaphore is not first
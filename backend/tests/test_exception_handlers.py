@@ -0,0 +1,56 @@
+"""Tests for the API exception handlers."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core import exceptions as exc
+from app.main import EXCEPTION_HANDLERS
+
+
+def _client_raising(error: Exception) -> TestClient:
+    app = FastAPI(exception_handlers=EXCEPTION_HANDLERS)
+
+    @app.get("/fail")
+    async def fail():
+        raise error
+
+    return TestClient(app, raise_server_exceptions=False)
+
+
+ERROR_CASES = [
+    (exc.FileNotFoundError("a.pdf"), 404),
+    (exc.InvalidFileTypeError("a.txt", [".pdf"]), 400),
+    (exc.FileTooLargeError("a.pdf", 12.0, 10), 413),
+    (exc.PDFExtractionError("a.pdf", "corrupt"), 422),
+    (exc.ScannedPDFError("a.pdf"), 422),
+    (exc.EmptyPDFError("a.pdf"), 422),
+    (exc.LLMConnectionError("http://localhost:11434", "refused"), 503),
+    (exc.LLMTimeoutError(), 504),
+    (exc.LLMResponseError("bad json"), 502),
+    (exc.ModelNotFoundError("phi3:mini"), 503),
+    (exc.DocumentTypeDetectionError(), 422),
+    (exc.UnsupportedDocumentTypeError("memo", ["invoice"]), 422),
+    (exc.ValidationError([{"field": "total"}]), 422),
+    (exc.LowConfidenceError(0.2, 0.5), 422),
+    (exc.ExtractionParseError("no JSON found"), 422),
+    (exc.PDFExtractorError("boom"), 400),
+]
+
+
+@pytest.mark.parametrize(
+    ("error", "expected_status"),
+    ERROR_CASES,
+    ids=[error.code for error, _ in ERROR_CASES],
+)
+def test_error_code_maps_to_http_status(error, expected_status):
+    response = _client_raising(error).get("/fail")
+
+    assert response.status_code == expected_status
+    body = response.json()
+    assert body["success"] is False
+    assert body["error"]["code"] == error.code
+
+
+def test_cases_cover_every_mapped_code():
+    assert set(exc.CODE_TO_STATUS) <= {error.code for error, _ in ERROR_CASES}
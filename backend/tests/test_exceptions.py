@@ -0,0 +1,33 @@
+"""Tests for the custom exception hierarchy."""
+
+from app.core import ExtractionParseError, make_parse_error
+from app.core.exceptions import RAW_RESPONSE_PREFIX_LENGTH
+
+
+def test_parse_error_keeps_a_truncated_prefix_and_full_length():
+    raw = "x" * (RAW_RESPONSE_PREFIX_LENGTH + 1500)
+
+    error = make_parse_error(raw, "No JSON object found")
+
+    assert error.to_dict()["details"] == {
+        "reason": "No JSON object found",
+        "raw_prefix": "x" * RAW_RESPONSE_PREFIX_LENGTH,
+        "raw_length": len(raw),
+    }
+
+
+def test_parse_error_keeps_short_responses_whole():
+    error = make_parse_error('{"total": ', "Unterminated object")
+
+    assert error.details["raw_prefix"] == '{"total": '
+    assert error.details["raw_length"] == 10
+
+
+def test_parse_error_without_raw_response():
+    error = ExtractionParseError("Empty response")
+
+    assert error.details == {
+        "reason": "Empty response",
+        "raw_prefix": None,
+        "raw_length": None,
+    }
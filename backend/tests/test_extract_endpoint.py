@@ -0,0 +1,46 @@
+"""Tests for the single-file extraction endpoint."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core import get_settings
+from app.main import app
+from app.schemas import ExtractionResponse
+from app.services.extraction import ExtractionOrchestrator
+from app.services.extraction.orchestrator import ExtractionResult
+
+EXTRACT_URL = f"{get_settings().api_prefix}/extract/"
+
+
+@pytest.fixture
+def client():
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def fake_extraction(monkeypatch):
+    def extract_from_pdf(self, file_path, force_type=None):
+        return ExtractionResult(
+            success=True,
+            document_type="invoice",
+            extracted_fields={"invoice_number": "INV-001", "total_amount": 120.5},
+        )
+
+    monkeypatch.setattr(ExtractionOrchestrator, "extract_from_pdf", extract_from_pdf)
+
+
+def test_extract_returns_an_extraction_response(client, fake_extraction):
+    response = client.post(
+        EXTRACT_URL,
+        files={"file": ("invoice.pdf", b"%PDF-1.4 test", "application/pdf")},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    body = ExtractionResponse.model_validate(response.json())
+    assert body.status == "success"
+    assert body.document.filename == "invoice.pdf"
+    assert body.document.detected_type == "invoice"
+    assert body.extracted_data == {"invoice_number": "INV-001", "total_amount": 120.5}
+    assert body.validation is not None and body.validation.fields_extracted == 2
@@ -0,0 +1,18 @@
+"""Tests for the root and health endpoints."""
+
+from fastapi.testclient import TestClient
+
+from app.core import get_settings
+from app.main import app
+
+
+def test_health_endpoints_work_without_lifespan():
+    client = TestClient(app)
+
+    for path in ("/", "/health", f"{get_settings().api_prefix}/health"):
+        response = client.get(path)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+
+    assert client.get("/health").json()["version"] == get_settings().app_version
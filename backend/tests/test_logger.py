@@ -0,0 +1,30 @@
+"""Tests for the Rich-based logger."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+
+def _rich_loaded_after(statement: str) -> bool:
+    # A fresh interpreter, since other tests may already have imported Rich
+    code = f"import sys; {statement}; print('rich' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.splitlines()[-1] == "True"
+
+
+def test_importing_core_does_not_load_rich():
+    assert not _rich_loaded_after("import app.core")
+
+
+def test_rich_is_loaded_on_first_log():
+    assert _rich_loaded_after(
+        "from app.core import get_logger; get_logger().info('hello')"
+    )
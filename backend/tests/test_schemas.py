@@ -0,0 +1,114 @@
+"""Tests for the shared schema helpers."""
+
+import math
+from decimal import Decimal
+
+import pytest
+from pydantic import ValidationError as PydanticValidationError
+
+from app.schemas import (
+    FieldConfidence,
+    InvoiceData,
+    LineItem,
+    ResumeData,
+    ValidationResult,
+    ValidationSeverity,
+    ValidationSummary,
+    validate_resumes,
+)
+from app.schemas.resume import _resume_list_adapter
+
+
+@pytest.mark.parametrize(
+    ("score", "expected"),
+    [
+        (0.0, FieldConfidence.LOW),
+        (0.4999999999999999, FieldConfidence.LOW),
+        (0.5, FieldConfidence.MEDIUM),
+        (0.7999999999999999, FieldConfidence.MEDIUM),
+        (0.8, FieldConfidence.HIGH),
+        (1.0, FieldConfidence.HIGH),
+        (math.nan, FieldConfidence.LOW),
+        (math.inf, FieldConfidence.HIGH),
+        (-math.inf, FieldConfidence.LOW),
+    ],
+)
+def test_confidence_from_score(score, expected):
+    assert FieldConfidence.from_score(score) is expected
+
+
+def test_invoice_field_summary_reflects_assignment():
+    invoice = InvoiceData()
+    assert invoice.get_field_summary()["invoice_number"] is False
+
+    invoice.invoice_number = "INV-001"
+
+    assert invoice.get_field_summary()["invoice_number"] is True
+
+
+def test_resume_field_summary_reflects_assignment():
+    resume = ResumeData()
+    assert resume.get_field_summary()["skills"] is False
+
+    resume.skills = ["Python"]
+
+    assert resume.get_field_summary()["skills"] is True
+
+
+def test_line_item_consistency_accepts_int_quantity():
+    item = LineItem(description="Widget", quantity=2, unit_price="5.00", amount="10.00")
+
+    # Assignment is not validated, so quantity stays an int
+    item.quantity = 3
+    item.amount = Decimal("15.00")
+
+    assert item.amount_is_consistent()
+
+
+def test_issue_buckets_reflect_later_changes_to_issues():
+    critical = ValidationResult(
+        field_name="total_amount",
+        is_valid=False,
+        severity=ValidationSeverity.CRITICAL,
+    )
+    summary = ValidationSummary(is_valid=False, issues=[critical])
+    assert summary.issues_by_severity == {ValidationSeverity.CRITICAL: [critical]}
+
+    warning = ValidationResult(
+        field_name="due_date",
+        is_valid=False,
+        severity=ValidationSeverity.WARNING,
+    )
+    summary.issues.append(warning)
+
+    assert summary.issues_by_severity[ValidationSeverity.WARNING] == [warning]
+    assert summary.get_issues_by_severity(ValidationSeverity.WARNING) == [warning]
+
+    summary.issues = []
+
+    assert summary.issues_by_severity == {}
+    assert summary.get_issues_by_severity(ValidationSeverity.CRITICAL) == []
+
+
+def test_validate_resumes_builds_its_adapter_lazily():
+    # Start from an unbuilt adapter; the first call builds it
+    _resume_list_adapter.cache_clear()
+
+    resumes = validate_resumes(
+        [
+            {"candidate_name": "Jane Doe", "skills": ["Python"]},
+            {"candidate_name": "John Roe", "email": "john@example.com"},
+        ]
+    )
+
+    assert [type(resume) for resume in resumes] == [ResumeData, ResumeData]
+    assert resumes[0].skills == ["Python"]
+    assert resumes[1].email == "john@example.com"
+    assert _resume_list_adapter.cache_info().currsize == 1
+
+
+def test_validate_resumes_reports_the_failing_item():
+    with pytest.raises(PydanticValidationError) as exc_info:
+        validate_resumes([{"candidate_name": "Jane Doe"}, {"skills": 42}])
+
+    assert exc_info.value.errors()[0]["loc"][0] == 1